@@ -29,13 +29,17 @@ _version = "Autumn 2024"
 
 import sys
 import os.path
+import math
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import cv2
 import matplotlib as plt
 
 try:
-	from PyQt5.QtCore import Qt, QPoint, QRect, QSize, QT_VERSION_STR, pyqtSignal  
-	from PyQt5.QtGui import QImage, QPixmap, QTransform
+	from PyQt5.QtCore import (Qt, QPoint, QPointF, QRect, QSize, QT_VERSION_STR, pyqtSignal, 
+			QObject, QRunnable, QThreadPool)
+	from PyQt5.QtGui import QImage, QImageReader, QPixmap, QTransform
 	from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QFileDialog, QLabel, 
 				QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QRubberBand)
 except ImportError:
@@ -48,7 +52,7 @@ from files.clsFilterDialog import FilterDialog
 from files.clsThresholdDialog import ThresholdDialog
 from files.clsResizeDialog import ResizeDialog
 # some simple methods for image processing
-from files.myImageTools import smoothFilter, qimage2np, np2qimage
+from files.myImageTools import smoothFilter, np2qimage
 
 try:
 	from files.myTools import DBpath # my DropBox
@@ -57,6 +61,193 @@ except:
 	myPath = ""                # path where you may have some images
 #end try, import DBpath  
 
+try:
+	from numba import njit, prange
+	numbaOK = True
+except ImportError:
+	numbaOK = False   # --> may run program even without numba, numpy is used instead
+#end try, import numba
+
+_cvThreads = max(1, (os.cpu_count() or 1) - 1)   # threads OpenCV may use, one is left for the GUI
+cv2.setUseOptimized(True)   # use the SIMD (SSE/AVX) code paths OpenCV is built with
+cv2.setNumThreads(_cvThreads)
+
+_toGrayCode = {3: cv2.COLOR_BGR2GRAY, 4: cv2.COLOR_BGRA2GRAY}   # cvtColor code for number of channels
+# QImage format that uses the memory of a uint8 numpy image as it is, for number of channels 
+# (b,g,r) needs Format_BGR888 which is in Qt 5.14 or newer, (b,g,r,a) is ARGB32 on little endian
+_qImageFormat = {1: QImage.Format_Grayscale8, 3: getattr(QImage, 'Format_BGR888', None), 4: QImage.Format_ARGB32}
+
+if numbaOK:
+	@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+	def _gradMag(Eh, Ev, out):
+		"""Set 'out' to sqrt(1 + Eh^2 + Ev^2), one pass over the 2D arrays (rows in parallel).
+		'out' may be 'Eh' (or 'Ev'), each element is read before it is written.
+		"""
+		for i in prange(Eh.shape[0]):
+			for j in range(Eh.shape[1]):
+				out[i,j] = math.sqrt(1.0 + Eh[i,j]*Eh[i,j] + Ev[i,j]*Ev[i,j])
+		return
+	
+	@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+	def _gradMagU8(Eh, Ev, c, out):
+		"""Set uint8 'out' to sqrt(c + Eh^2 + Ev^2) scaled (and rounded) so that its max is 255.
+		The first pass over the rows finds the max, the second pass finds the magnitude again 
+		and writes it, no float image is made. 'Eh' and 'Ev' may be int16 or float arrays.
+		"""
+		(m, n) = Eh.shape
+		rowMax = np.zeros(m, dtype=np.float64)
+		for i in prange(m):
+			mx = 0.0
+			for j in range(n):
+				(a, b) = (float(Eh[i,j]), float(Ev[i,j]))
+				mx = max(mx, c + a*a + b*b)
+			rowMax[i] = mx
+		gmax = math.sqrt(rowMax.max()) if (m > 0) else 0.0
+		scale = (255.0/gmax) if (gmax > 0.0) else 0.0
+		for i in prange(m):
+			for j in range(n):
+				(a, b) = (float(Eh[i,j]), float(Ev[i,j]))
+				out[i,j] = np.uint8(min(math.sqrt(c + a*a + b*b)*scale + 0.5, 255.0))
+		return
+#end if numbaOK
+
+def _edgeGradients(B, valK):
+	"""Return derivatives (Eh, Ev) of image 'B' using Sobel filters of size 'valK'.
+	For 'valK' == 3 and a uint8 gray scale image cv2.spatialGradient finds both derivatives 
+	in one pass. For a uint8 image the derivatives are int16 arrays, OpenCV is fastest then, 
+	but for 'valK' > 5 they may be larger than int16 and float32 arrays are returned.
+	"""
+	if (valK == 3) and (B.dtype == np.uint8) and (B.ndim == 2):
+		(Ev, Eh) = cv2.spatialGradient(B)   # (dx, dy) as int16
+	elif (valK <= 5) and (B.dtype == np.uint8):   # max |E| is 255*6*16 for valK == 5
+		Eh = cv2.Sobel(B, ddepth=cv2.CV_16S, dx=0, dy=1, ksize=valK)
+		Ev = cv2.Sobel(B, ddepth=cv2.CV_16S, dx=1, dy=0, ksize=valK)
+	else:
+		Eh = cv2.Sobel(B, ddepth=cv2.CV_32F, dx=0, dy=1, ksize=valK)
+		Ev = cv2.Sobel(B, ddepth=cv2.CV_32F, dx=1, dy=0, ksize=valK)
+	return (Eh, Ev)
+
+def _edgeMagnitude(B, valK):
+	"""Return the gradient magnitude (float32) of image 'B' using Sobel filters of size 'valK'."""
+	(Eh, Ev) = _edgeGradients(B, valK)
+	(Eh, Ev) = (Eh.astype(np.float32, copy=False), Ev.astype(np.float32, copy=False))
+	# print( f"_edgeMagnitude: Eh is an array of {Eh.dtype.name}, shape {str(Eh.shape)}" )
+	# Eh is not used after this, so the magnitude is written into it (no new array)
+	if numbaOK and (Eh.ndim == 2):
+		_gradMag(Eh, Ev, Eh)
+	else:   # the same sqrt(1 + Eh^2 + Ev^2) as _gradMag(), in place
+		np.square(Eh, out=Eh)
+		Eh += np.square(Ev, out=Ev)
+		Eh += 1.0
+		np.sqrt(Eh, out=Eh)
+	return Eh
+
+_filterPool = None   # ThreadPoolExecutor used by _parallelSepFilter2D(), made when first needed
+
+def _parallelSepFilter2D(B, kX, kY, minSize=100_000):
+	"""Return cv2.sepFilter2D(B, ddepth=-1, kernelX=kX, kernelY=kY), for a large image 'B' 
+	the rows are split into one band for each CPU and the bands are filtered in threads 
+	(OpenCV releases the GIL). Image is padded (BORDER_REFLECT_101, as the default 
+	in sepFilter2D) once, then each band has the rows its kernel needs and result is the same.
+	"""
+	global _filterPool
+	n = min(cv2.getNumberOfCPUs(), B.shape[0] // 16)
+	if (B.shape[0]*B.shape[1] <= minSize) or (n < 2):
+		return cv2.sepFilter2D(B, ddepth=-1, kernelX=kX, kernelY=kY)
+	if _filterPool is None:
+		_filterPool = ThreadPoolExecutor(max_workers=cv2.getNumberOfCPUs())
+	p = np.size(kY)//2
+	P = cv2.copyMakeBorder(B, p, p, 0, 0, cv2.BORDER_REFLECT_101)
+	rows = np.linspace(0, B.shape[0], n+1).astype(int)   # band i is rows[i] to rows[i+1]
+	def band(i):
+		(r0, r1) = (rows[i], rows[i+1])
+		return cv2.sepFilter2D(P[r0:r1+2*p], ddepth=-1, kernelX=kX, kernelY=kY)[p:p+r1-r0]
+	return np.concatenate(list(_filterPool.map(band, range(n))), axis=0)
+
+_smoothKernels = {}   # valS --> (a, isBox), the filters from smoothFilter(len=valS) are made once
+
+def _smoothImage(B, valS, parallel=True):
+	"""Low-pass filter image 'B' with the separable filter given by smoothFilter(len=valS).
+	A uniform filter is done by cv2.boxFilter which is faster than the general cv2.sepFilter2D.
+	If 'parallel' is False the image is not split into bands filtered in threads.
+	"""
+	if valS not in _smoothKernels:
+		a = smoothFilter(len=valS)
+		a1 = np.ravel(a)
+		_smoothKernels[valS] = (a, bool(np.allclose(a1, a1[0]) and np.isclose(a1.sum(), 1.0)))
+	(a, isBox) = _smoothKernels[valS]
+	if isBox:
+		return cv2.boxFilter(B, ddepth=-1, ksize=(a.size, a.size))
+	if not parallel:
+		return cv2.sepFilter2D(B, ddepth=-1, kernelX=a, kernelY=a)
+	return _parallelSepFilter2D(B, a, a)
+
+def _edgeImage(B, valK, valS):
+	"""Return edge image (uint8) for gray scale image 'B', as used by tryEdges() and toEdges().
+	Sobel filters of size 'valK' and low-pass filter of length 'valS' are used.
+	"""
+	# B = cv2.GaussianBlur(B, 11, 2.5)  # sizeK and sigma ??
+	# Eh = cv2.Sobel(B, ddepth=cv2.CV_16S, dx=0, dy=1, ksize=valK)
+	# Ev = cv2.Sobel(B, ddepth=cv2.CV_16S, dx=1, dy=0, ksize=valK)
+	# Eh = Eh.astype(np.float32)
+	# Ev = Ev.astype(np.float32) 
+	if numbaOK and (valS <= 1) and (B.ndim == 2):   # no smoothing, magnitude to uint8 in one kernel
+		(Eh, Ev) = _edgeGradients(B, valK)
+		E = np.empty(Eh.shape, dtype=np.uint8)
+		_gradMagU8(Eh, Ev, 1.0, E)
+		return E
+	B = _edgeMagnitude(B, valK)
+	# B = cv2.Sobel(B, ddepth=cv2.CV_16S, dx=1, dy=1, ksize=valK)  # hmmm
+	if (valS > 1):
+		B = _smoothImage(B, valS)
+	# print( f"_edgeImage: B is an array of {B.dtype.name}, shape {str(B.shape)}" )
+	# print( f"            min(B) {np.min(B):8.2f},  max(B) {np.max(B):8.2f}" )
+	return cv2.normalize(B, None, alpha=255, norm_type=cv2.NORM_INF, dtype=cv2.CV_8U)  # scale so max(B) is 255
+
+def _filterImage(B, h, valS, parallel=True):
+	"""Return filtered image (uint8) for gray scale image 'B', as used by tryFilter() and filterImage().
+	Filter 'h' (if len(h) > 1) and low-pass filter of length 'valS' are used, then result is 
+	scaled so min is 0 and max is 255. With no filters the result is just the scaled 'B', 
+	and if 'B' is uint8 with min 0 and max 255 'B' itself is returned (nothing to do).
+	'parallel' is given to _smoothImage(), False is faster for a small (preview) image.
+	"""
+	if (len(h) <= 1) and (valS <= 1):
+		if (B.dtype == np.uint8) and (B.ndim == 2) and (cv2.minMaxLoc(B)[:2] == (0.0, 255.0)):
+			return B
+		return cv2.normalize(B, None, alpha=0, beta=255, norm_type=cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+	if (len(h) > 1):
+		B = cv2.filter2D(B, ddepth=cv2.CV_16S, kernel=h).astype(np.float32) 
+	else:
+		B = B.astype(np.float32)
+	if (valS > 1):
+		B = _smoothImage(B, valS, parallel)
+	return cv2.normalize(B, None, alpha=0, beta=255, norm_type=cv2.NORM_MINMAX, dtype=cv2.CV_8U)  # min to 0, max to 255
+
+class WorkerSignals(QObject):
+	"""Signals used by Worker, a QRunnable can not have signals itself."""
+	done = pyqtSignal(int, object)   # job id and result 
+	
+class Worker(QRunnable):
+	"""Run 'fun(*args)' in a thread from QThreadPool, this keeps the GUI responsive.
+	When finished the result is emitted by signal 'signals.done' together with 'jobId'.
+	If 'fun' raises an exception the exception is emitted as the result, so 'done' is always emitted.
+	Most of the time is spent in OpenCV and numpy, and they release the GIL.
+	"""
+	def __init__(self, jobId, fun, *args):
+		super().__init__()
+		self.signals = WorkerSignals()
+		(self.jobId, self.fun, self.args) = (jobId, fun, args)
+		return
+		
+	def run(self):
+		try:
+			B = self.fun(*self.args)
+		except Exception as exc:
+			B = exc
+		self.signals.done.emit(self.jobId, B)
+		return
+	#end class Worker
+	
 class MyGraphicsView(QGraphicsView):
 	"""This is the viewer where the pixmap is shown, it is a simple extension of QGraphicsView.
 	
@@ -80,8 +271,48 @@ class MyGraphicsView(QGraphicsView):
 		self.rubberBand = QRubberBand(QRubberBand.Rectangle, self)
 		self.rubberBand.hide()
 		self.rubberBandActive = False
+		self.lastXY = (-1,-1)   # pixel (x,y) for last position information text
+		self.invT = None        # inverted view transform, made when needed
+		self.scrollXY = (0,0)   # scroll offset used together with self.invT
+		scene.sceneRectChanged.connect(self.resetInvT)
 		return	# __init__(self)
 		
+	def resetInvT(self, *args):
+		"""Forget the cached view to scene transform, to be called when scale, scroll or size changes."""
+		self.invT = None
+		return
+		
+	def mapToPixel(self, pos):
+		"""Return (x,y), the pixel index in scene, for position 'pos' in the view.
+		It gives the same as mapToScene(pos) but uses a cached (inverted) transform.
+		"""
+		if self.invT is None:
+			(t, vt) = (self.transform(), self.viewportTransform())   # vt includes scroll
+			self.invT = t.inverted()[0]
+			self.scrollXY = (t.dx() - vt.dx(), t.dy() - vt.dy())
+		posScene = self.invT.map(QPointF(pos.x() + self.scrollXY[0], pos.y() + self.scrollXY[1]))
+		return (int(posScene.x()), int(posScene.y()))
+		
+	def setTransform(self, matrix, combine=False):
+		super().setTransform(matrix, combine)
+		self.resetInvT()
+		return
+		
+	def scale(self, sx, sy):
+		super().scale(sx, sy)
+		self.resetInvT()
+		return
+		
+	def scrollContentsBy(self, dx, dy):
+		super().scrollContentsBy(dx, dy)
+		self.resetInvT()
+		return
+		
+	def resizeEvent(self, event):
+		super().resizeEvent(event)
+		self.resetInvT()
+		return
+		
 	def mousePressEvent(self, event):
 		"""Print where the mouse is when a mouse button is pressed.
 		Perhaps, if self.rubberBandActive, also start to show the rubber band.
@@ -91,8 +322,7 @@ class MyGraphicsView(QGraphicsView):
 		This method is a 'slot' that is called whenever a mouse button is pressed (in the view).
 		"""
 		p = self.parent()
-		posScene = self.mapToScene(event.pos())
-		(x,y) = (int(posScene.x()), int(posScene.y()))
+		(x,y) = self.mapToPixel(event.pos())
 		#
 		if (event.button() == Qt.LeftButton):
 			print( "MyGraphicsView.mousePressEvent: Press LeftButton at:  ", end='') 
@@ -114,11 +344,28 @@ class MyGraphicsView(QGraphicsView):
 		if self.rubberBandActive:
 			self.rubberBand.setGeometry(QRect(self.pos1, event.pos()).normalized())
 		# 
-		posScene = self.mapToScene(event.pos())
-		(x,y) = (int(posScene.x()), int(posScene.y()))
+		(x,y) = self.mapToPixel(event.pos())
+		if ((x,y) == self.lastXY):
+			return   # still on the same pixel, text is already set
+		self.lastXY = (x,y)
 		# p.pixmap and p.image should be same size
 		if ((x >= 0) and (y >= 0) and (y < p.pixmap.height()) and (x < p.pixmap.width())):
-			if not p.image.isNull():  
+			A = p.npImage if p.npImageMade() else None
+			if p.npImageShown and (A is not None) and (A.shape[:2] == (p.pixmap.height(), p.pixmap.width())):
+				# read pixel directly from the numpy array (BGR(A) or gray), no QColor is made
+				pix = A[y,x]
+				if (A.ndim == 2): 
+					if p.isAllGray: 
+						p.posInfo.setText( f"(x,y) = ({x},{y}):  gray = {pix}" )
+					else:
+						p.posInfo.setText( f"(x,y) = ({x},{y}):  gray/index  = {pix}" )
+				elif p.isAllGray: 
+					p.posInfo.setText( f"(x,y) = ({x},{y}):  gray = {pix[2]}" )
+				elif (A.shape[2] < 4) or (pix[3] == 255):
+					p.posInfo.setText( f"(x,y) = ({x},{y}):  (r,g,b) = ({pix[2]},{pix[1]},{pix[0]})" )
+				else:
+					p.posInfo.setText( f"(x,y) = ({x},{y}):  (r,g,b,a) = ({pix[2]},{pix[1]},{pix[0]},{pix[3]})" )
+			elif not p.image.isNull():  
 				col = p.image.pixelColor(x, y)
 				if p.isAllGray: 
 					p.posInfo.setText( f"(x,y) = ({x},{y}):  gray = {col.red()}" )   # or col.value()
@@ -147,10 +394,9 @@ class MyGraphicsView(QGraphicsView):
 			if self.rubberBandActive:
 				self.rubberBand.hide()
 				self.rubberBandActive = False
-				posScene = self.mapToScene(self.pos1)
-				(x,y) = (int(posScene.x()), int(posScene.y()))
-				posScene = self.mapToScene(event.pos())
-				(w,h) = (int(posScene.x())-x, int(posScene.y())-y)
+				(x,y) = self.mapToPixel(self.pos1)
+				(x2,y2) = self.mapToPixel(event.pos())
+				(w,h) = (x2-x, y2-y)
 				self.rubberBandRectGiven.emit( QRect(x,y,w,h).normalized() )
 				# without the signal we could assume that the connected function is known here and just call it
 				# self.parent().cropEnd(QRect(x,y,w,h).normalized())
@@ -175,13 +421,31 @@ class MainWindow(QMainWindow):
 		self.appFileName = _appFileName 
 		self.setGeometry(150, 50, 1400, 800)  # initial window position and size
 		self.scaleUpFactor = np.sqrt(2.0)
+		self.verbose = True          # printInfo() does nothing when False
 		#
 		self.pixmap = QPixmap()      # a null pixmap
 		self.prevPixmap = QPixmap()  # another (for previous pixmap)
 		self.image = QImage()        # a null image
 		self.isAllGray = False       # true when self.image.allGray(), function is slow for images without color table
-		self.npImage = np.array([])  # size == 0 
+		self._npImage = np.array([]) # size == 0, None when it should be made from self.image
+		self._imgVersion = 0         # increased each time self.npImage is set (or drawn on)
+		self._grayVersion = -1       # self._imgVersion when self._gray was made
+		self._gray = None            # gray scale version of self.npImage, see _getGray()
+		self._grayBuf = None         # the array cvtColor() writes the gray image into, reused for same size
+		self._grayF32 = None         # and as float32, see _getGrayF32()
+		self._grayF32Version = -1    # self._grayVersion when self._grayF32 was filled
+		self.npImageShown = False    # true when 'self.npImage' is the image shown as pixmap
+		self.imageBuffer = None      # numpy array that may hold the pixels of self.image
 		self.cropActive = False
+		self.edgeJobId = 0           # id of last edge job, only its result is shown
+		self.edgePool = QThreadPool(self)   # edge jobs run one at a time, see tryEdges()
+		self.edgePool.setMaxThreadCount(1)
+		self.edgeRunning = False     # true while an edge job is running in self.edgePool
+		self.edgePending = None      # (valK, valS) for the next edge job, only the latest values are kept
+		self.binBuf = None           # reused by tryBinary() for the thresholded preview image
+		self.edgeDlg = None          # the dialogs are made the first time they are used, and then reused
+		self.filterDlg = None
+		self.thresholdDlg = None
 		#
 		self.scene = QGraphicsScene()
 		self.curItem = None          # (a pointer to) pixmap on scene
@@ -351,7 +615,15 @@ class MainWindow(QMainWindow):
 		elif (value > 0):
 			self.isAllGray = True
 		else:
-			if (not self.image.isNull()): 
+			A = self.npImage if self.npImageMade() else None
+			if self.npImageShown and (A is not None) and (A.size > 0): 
+				# compare color channels in numpy, faster than QImage.allGray()
+				if (A.ndim == 2) or (A.shape[2] < 3):
+					self.isAllGray = True
+				else:
+					self.isAllGray = (np.array_equal(A[:,:,0], A[:,:,1]) and 
+									  np.array_equal(A[:,:,1], A[:,:,2]))
+			elif (not self.image.isNull()): 
 				self.isAllGray = self.image.allGray()
 			else:
 				self.isAllGray = False
@@ -360,20 +632,88 @@ class MainWindow(QMainWindow):
 		self.setMenuItems()
 		return
 		
-	def pixmap2image2np(self):
-		"""Display 'self.pixmap' on scene and copy it to 'self.image' and to 'self.npImage'."""
-		if self.curItem: 
-			self.scene.removeItem(self.curItem)
-		self.curItem = QGraphicsPixmapItem(self.pixmap)
-		self.scene.addItem(self.curItem)
+	@property
+	def npImage(self):
+		"""The image as a numpy array, made from 'self.image' the first time it is used."""
+		if self._npImage is None:
+			(w, h) = (self.image.width(), self.image.height())
+			nc = 4 if (self.image.format() == QImage.Format_ARGB32) else 3   # skip the unused fourth byte
+			ptr = self.image.constBits()
+			ptr.setsize(self.image.sizeInBytes())
+			A = np.frombuffer(ptr, dtype=np.uint8).reshape(h, w, 4)   # a view, it uses memory of self.image 
+			self._npImage = A[:,:,:nc].copy()
+			if self.isAllGray:   # gray, then 2D is enough
+				self._npImage = self._npImage[:,:,0]
+		return self._npImage
+	
+	@npImage.setter
+	def npImage(self, A):
+		self._npImage = A
+		self._imgVersion += 1   # any cached gray image is old now
+		return
+	
+	def _getGray(self):
+		"""Return 'self.npImage' as a gray scale (2D) image, it is made once for each new npImage.
+		The gray image is written into the same array as long as size (and type) of the image is the same,
+		so a caller that keeps the result should take the array over, see toGray().
+		"""
+		if (self._grayVersion != self._imgVersion) or (self._gray is None):
+			A = self.npImage
+			if (A.ndim == 3) and (A.shape[2] in _toGrayCode):
+				if (self._grayBuf is None) or (self._grayBuf.shape != A.shape[:2]) or (self._grayBuf.dtype != A.dtype):
+					self._grayBuf = np.empty(A.shape[:2], dtype=A.dtype)
+				self._gray = cv2.cvtColor(A, _toGrayCode[A.shape[2]], dst=self._grayBuf)
+			else:
+				self._gray = A   # most likely already gray 
+			self._grayVersion = self._imgVersion
+		return self._gray
+	
+	def _getGrayF32(self):
+		"""Return the gray scale image from _getGray() as float32, made once for each new npImage.
+		The float32 array is reused as long as the size of the image is the same.
+		"""
+		gray = self._getGray()
+		if (self._grayF32Version != self._grayVersion):
+			if (self._grayF32 is None) or (self._grayF32.shape != gray.shape):
+				self._grayF32 = np.empty(gray.shape, dtype=np.float32)
+			np.copyto(self._grayF32, gray, casting='unsafe')
+			self._grayF32Version = self._grayVersion
+		return self._grayF32
+	
+	def npImageMade(self):
+		"""Return True if 'self.npImage' is made, i.e. using it does not copy 'self.image'."""
+		return (self._npImage is not None)
+		
+	def setPixmapItem(self):
+		"""Show 'self.pixmap' on scene, the pixmap item is made once and then reused."""
+		if self.curItem is None:
+			self.curItem = QGraphicsPixmapItem(self.pixmap)
+			self.scene.addItem(self.curItem)
+		else:
+			self.curItem.setPixmap(self.pixmap)
+		self.scene.setSceneRect(0, 0, self.pixmap.width(), self.pixmap.height())
+		return
+		
+	def pixmap2image2np(self, image=None):
+		"""Display 'self.pixmap' on scene and copy it to 'self.image', 
+		'self.npImage' is made from 'self.image' when it is used.
+		If 'image' is given it is used as 'self.image', it should be the image the pixmap 
+		was made from, in format QImage.Format_RGB32 or QImage.Format_ARGB32.
+		"""
+		self.setPixmapItem()
 		(w, h) = (self.pixmap.width(), self.pixmap.height())
-		self.scene.setSceneRect(0, 0, w, h)
 		#
-		self.image = self.pixmap.toImage()
-		self.setIsAllGray()
-		self.npImage = qimage2np(self.image)
-		if self.isAllGray and (len(self.npImage.shape) == 3):   # gray and 3D ?
-			self.npImage = self.npImage[:,:,0]
+		# use a 32 bit format, (b,g,r,a) in memory, then numpy array is one copy of the pixels
+		if image is not None:
+			self.image = image   # no copy
+		elif self.pixmap.hasAlpha():
+			self.image = self.pixmap.toImage().convertToFormat(QImage.Format_ARGB32)
+		else:
+			self.image = self.pixmap.toImage().convertToFormat(QImage.Format_RGB32)
+		self.npImage = None   # made from self.image when needed
+		self.npImageShown = True
+		self.view.lastXY = (-1,-1)   # pixel values may have changed
+		self.setIsAllGray()   # uses self.image.allGray() since self.npImage is not made yet
 		#
 		self.status.setText( f"pixmap: (w,h) = ({w},{h})" )
 		self.scaleOne() 
@@ -388,17 +728,27 @@ class MainWindow(QMainWindow):
 			print("np2image2pixmap: argument 'B' is not numpy array.")
 			return
 		#
-		self.image = np2qimage(B) 
+		if (not numpyAlso) and (not self.npImageMade()):
+			self.npImage = self.npImage   # make it now, before self.image is replaced
+		#
+		fmt = None
+		if (B.dtype == np.uint8) and (B.ndim in (2,3)):   # let QImage use the memory of B, no copy into QImage
+			fmt = _qImageFormat.get(1 if (B.ndim == 2) else B.shape[2])
+		#
+		if fmt is None: 
+			self.image = np2qimage(B) 
+		else:
+			B = np.ascontiguousarray(B)
+			self.imageBuffer = B   # self.image uses this memory, keep it alive
+			self.image = QImage(B.data, B.shape[1], B.shape[0], B.strides[0], fmt)
 		if (not self.image.isNull()):
 			self.pixmap = QPixmap.fromImage(self.image)
-			if self.curItem: 
-				self.scene.removeItem(self.curItem)
-			self.curItem = QGraphicsPixmapItem(self.pixmap)
-			self.scene.addItem(self.curItem)
-			self.scene.setSceneRect(0, 0, self.pixmap.width(), self.pixmap.height())
+			self.setPixmapItem()
 		#
 		if numpyAlso:
 			self.npImage = B
+		self.npImageShown = numpyAlso
+		self.view.lastXY = (-1,-1)   # pixel values may have changed
 		#
 		self.setIsAllGray()
 		return
@@ -424,12 +774,19 @@ class MainWindow(QMainWindow):
 			print( f"MainWindow.openFile( {fName} )  input is empty string" )
 		else:
 			self.removePixmapItem()
-			self.pixmap.load(fName) 
+			reader = QImageReader(fName)   # reads only the header until read() is called
+			image = reader.read() if reader.canRead() else QImage()   # null if file is missing or format is unknown
+			if not image.isNull():
+				# the decoded image is kept as self.image, converted (once) to the 32 bit format used there
+				fmt = QImage.Format_ARGB32 if image.hasAlphaChannel() else QImage.Format_RGB32
+				if (image.format() != fmt):
+					image = image.convertToFormat(fmt)
+			self.pixmap = QPixmap.fromImage(image)   # a null pixmap for a null image
 			if self.pixmap.isNull(): 
 				self.setWindowTitle( f"MainWindow.openFile: error for file {fName}" )  
 			else:
 				self.setWindowTitle( f"{self.appFileName} : {fName}" )
-				self.pixmap2image2np()
+				self.pixmap2image2np(image)
 		# end if
 		self.setMenuItems() 
 		return
@@ -473,49 +830,53 @@ class MainWindow(QMainWindow):
 	
 	def printInfo(self):
 		"""Print some general (debug) information for the program and the image."""
-		print( "Print some elements of MainWindow(QMainWindow) object.")
-		print( f"myPath             = {str(myPath)}" )
-		print( f"self               = {str(self)}" )
-		print( f"  .parent()          = {str(self.parent())}" )
-		print( f"  .appFileName       = {str(self.appFileName)}" )
-		print( f"  .pos()             = {str(self.pos())}" )
-		print( f"  .size()            = {str(self.size())}" )
-		print( f"  .isAllGray         = {str(self.isAllGray)}" )
-		print( f"  .cropActive        = {str(self.cropActive)}" )
-		print( f"  .scaleUpFactor     = {str(self.scaleUpFactor)}" )
-		print( f"  .curItem           = {str(self.curItem)}" )
+		if not self.verbose:
+			return
+		lines = []   # collect all lines and print them at once
+		lines.append( "Print some elements of MainWindow(QMainWindow) object.")
+		lines.append( f"myPath             = {str(myPath)}" )
+		lines.append( f"self               = {str(self)}" )
+		lines.append( f"  .parent()          = {str(self.parent())}" )
+		lines.append( f"  .appFileName       = {str(self.appFileName)}" )
+		lines.append( f"  .pos()             = {str(self.pos())}" )
+		lines.append( f"  .size()            = {str(self.size())}" )
+		lines.append( f"  .isAllGray         = {str(self.isAllGray)}" )
+		lines.append( f"  .cropActive        = {str(self.cropActive)}" )
+		lines.append( f"  .scaleUpFactor     = {str(self.scaleUpFactor)}" )
+		lines.append( f"  .verbose           = {str(self.verbose)}" )
+		lines.append( f"  .curItem           = {str(self.curItem)}" )
 		if isinstance(self.curItem, QGraphicsPixmapItem):
-			print( f"    .parentWidget()    = {str(self.curItem.parentWidget())}" )
-			print( f"    .parentObject()    = {str(self.curItem.parentObject())}" )
-			print( f"    .parentItem()      = {str(self.curItem.parentItem())}" )
+			lines.append( f"    .parentWidget()    = {str(self.curItem.parentWidget())}" )
+			lines.append( f"    .parentObject()    = {str(self.curItem.parentObject())}" )
+			lines.append( f"    .parentItem()      = {str(self.curItem.parentItem())}" )
 		#
-		print( f"self.view          = {str(self.view)}" )
-		print( f"  .parent()          = {str(self.view.parent())}" )
-		print( f"  .scene()           = {str(self.view.scene())}" )
-		print( f"  .pos()             = {str(self.view.pos())}" )
-		print( f"  .size()            = {str(self.view.size())}" )
+		lines.append( f"self.view          = {str(self.view)}" )
+		lines.append( f"  .parent()          = {str(self.view.parent())}" )
+		lines.append( f"  .scene()           = {str(self.view.scene())}" )
+		lines.append( f"  .pos()             = {str(self.view.pos())}" )
+		lines.append( f"  .size()            = {str(self.view.size())}" )
 		t = self.view.transform()
-		print( f"  .transform()       = {str(t)}" )
-		print( f"    .m11, .m12, .m13   = [{t.m11():5.2f}, {t.m12():5.2f}, {t.m13():5.2f}, " )
-		print( f"    .m21, .m22, .m23   =  {t.m21():5.2f}, {t.m22():5.2f}, {t.m23():5.2f}, " )
-		print( f"    .m31, .m32, .m33   =  {t.m31():5.2f}, {t.m32():5.2f}, {t.m33():5.2f} ]" )
-		print( f"self.scene         = {str(self.scene)}" )
-		print( f"  .parent()          = {str(self.scene.parent())}" )
-		print( f"  .sceneRect()       = {str(self.scene.sceneRect())}" )
-		print( f"  number of items    = {len(self.scene.items())}" )
+		lines.append( f"  .transform()       = {str(t)}" )
+		lines.append( f"    .m11, .m12, .m13   = [{t.m11():5.2f}, {t.m12():5.2f}, {t.m13():5.2f}, " )
+		lines.append( f"    .m21, .m22, .m23   =  {t.m21():5.2f}, {t.m22():5.2f}, {t.m23():5.2f}, " )
+		lines.append( f"    .m31, .m32, .m33   =  {t.m31():5.2f}, {t.m32():5.2f}, {t.m33():5.2f} ]" )
+		lines.append( f"self.scene         = {str(self.scene)}" )
+		lines.append( f"  .parent()          = {str(self.scene.parent())}" )
+		lines.append( f"  .sceneRect()       = {str(self.scene.sceneRect())}" )
+		lines.append( f"  number of items    = {len(self.scene.items())}" )
 		if len(self.scene.items()):
-			print( f"  first item         = {str(self.scene.items()[0])}" )
-		print( f"self.pixmap        = {str(self.pixmap)}" )
+			lines.append( f"  first item         = {str(self.scene.items()[0])}" )
+		lines.append( f"self.pixmap        = {str(self.pixmap)}" )
 		if not self.pixmap.isNull():
-			print( f"  .size()            = {str(self.pixmap.size())}" )
-			print( f"  .width()           = {str(self.pixmap.width())}" )
-			print( f"  .height()          = {str(self.pixmap.height())}" )
-			print( f"  .depth()           = {str(self.pixmap.depth())}" )
-			print( f"  .hasAlpha()        = {str(self.pixmap.hasAlpha())}" ) 
-			print( f"  .isQBitmap()       = {str(self.pixmap.isQBitmap())}" )
+			lines.append( f"  .size()            = {str(self.pixmap.size())}" )
+			lines.append( f"  .width()           = {str(self.pixmap.width())}" )
+			lines.append( f"  .height()          = {str(self.pixmap.height())}" )
+			lines.append( f"  .depth()           = {str(self.pixmap.depth())}" )
+			lines.append( f"  .hasAlpha()        = {str(self.pixmap.hasAlpha())}" ) 
+			lines.append( f"  .isQBitmap()       = {str(self.pixmap.isQBitmap())}" )
 		#end if pixmap
-		print( f"self.prevPixmap    = {str(self.prevPixmap)}" )
-		print( f"self.image         = {str(self.image)}" )
+		lines.append( f"self.prevPixmap    = {str(self.prevPixmap)}" )
+		lines.append( f"self.image         = {str(self.image)}" )
 		if not self.image.isNull():
 			if (self.image.format() == 3):
 				s2 = "3 (QImage.Format_Indexed8)"
@@ -524,20 +885,23 @@ class MainWindow(QMainWindow):
 			elif (self.image.format() == 5):
 				s2 = "5 (QImage.Format_ARGB32)"
 			else:
-				s2 = "{self.image.format()}" 
+				s2 = f"{self.image.format()}" 
 			#end
-			print( f"  .size()            = {str(self.image.size())}" )
-			print( f"  .width()           = {str(self.image.width())}" )
-			print( f"  .height()          = {str(self.image.height())}" )
-			print( f"  .depth()           = {str(self.image.depth())}" )
-			print( f"  .hasAlphaChannel() = {str(self.image.hasAlphaChannel())}" )
-			print( f"  .format()          = {s2}" )
-			print( f"  .allGray()         = {str(self.image.allGray())}" )
+			lines.append( f"  .size()            = {str(self.image.size())}" )
+			lines.append( f"  .width()           = {str(self.image.width())}" )
+			lines.append( f"  .height()          = {str(self.image.height())}" )
+			lines.append( f"  .depth()           = {str(self.image.depth())}" )
+			lines.append( f"  .hasAlphaChannel() = {str(self.image.hasAlphaChannel())}" )
+			lines.append( f"  .format()          = {s2}" )
+			lines.append( f"  .allGray()         = {str(self.image.allGray())}" )
 		#end if image
-		if isinstance(self.npImage, np.ndarray):   # also print information on this numpy array
-			print( (f"self.npImage()      = "
+		if not self.npImageMade():
+			lines.append( "self.npImage()      = not made yet, it is made from self.image when used" )
+		elif isinstance(self.npImage, np.ndarray):   # also print information on this numpy array
+			lines.append( (f"self.npImage()      = "
 					f"numpy {len(self.npImage.shape)}D array " + 
 					f"of {self.npImage.dtype.name}, shape {str(self.npImage.shape)}") )
+		print( "\n".join(lines) )
 		return
 	
 	def quitProgram(self):
@@ -602,47 +966,20 @@ class MainWindow(QMainWindow):
 			print( "cropImage(): Rubber band rectangle is small  --> Special case")
 			print( "  Cut out any frame of black rows and columns.")
 			print( f"  A = npImage is an array of {A.dtype.name}, shape {str(A.shape)}." )
-			# find what to crop,  
-			(left,right,top,bottom) = (0,0,0,0)
+			# find what to crop, reduce image to one activity flag for each column and each row
 			if (len(A.shape) == 3) and (A.shape[2] >= 3):  # color img
 				print("  This is a color image")
-				for column in range(0,A.shape[1]):
-					if ((A[:,column,0].max() > 0) or 
-						(A[:,column,1].max() > 0) or 
-						(A[:,column,2].max() > 0)): break
-					else: left += 1
-				for column in range(A.shape[1]-1,-1,-1):
-					if ((A[:,column,0].max() > 0) or 
-						(A[:,column,1].max() > 0) or 
-						(A[:,column,2].max() > 0)): break
-					else: right += 1
-				for row in range(0,A.shape[0]):
-					if ((A[row,:,0].max() > 0) or 
-						(A[row,:,1].max() > 0) or 
-						(A[row,:,2].max() > 0)): break
-					else: top += 1
-				for row in range(A.shape[0]-1,-1,-1):
-					if ((A[row,:,0].max() > 0) or 
-						(A[row,:,1].max() > 0) or 
-						(A[row,:,2].max() > 0)): break
-					else: bottom += 1
-				print( f"  end using   (left,right,top,bottom) = ({left},{right},{top},{bottom})" )
+				mono = A[:,:,:3].max(axis=2)   # max of (b,g,r) for each pixel
 			else:  # grayscale img
 				print( "  This is a gray scale image")
-				print( "  start using (left,right,top,bottom) = ({left},{right},{top},{bottom})" )
-				for column in range(0, A.shape[1]):
-					if (A[:,column].max() > 0): break
-					else: left += 1
-				for column in range(A.shape[1]-1,-1,-1):
-					if (A[:,column].max() > 0): break
-					else: right += 1
-				for row in range(0,A.shape[0]):
-					if (A[row,:].max() > 0): break
-					else: top += 1
-				for row in range(A.shape[0]-1,-1,-1):
-					if (A[row,:].max() > 0): break
-					else: bottom += 1
-				print( f"  end using   (left,right,top,bottom) = ({left},{right},{top},{bottom})" )
+				mono = A
+			(x, y, wBB, hBB) = cv2.boundingRect(mono)   # bounding box of pixels that are not black
+			if (wBB > 0) and (hBB > 0):
+				(left, right) = (x, A.shape[1] - (x + wBB))
+				(top, bottom) = (y, A.shape[0] - (y + hBB))
+			else:  # all black image, w and h below become negative and nothing is cropped
+				(left,right,top,bottom) = (A.shape[1],A.shape[1],A.shape[0],A.shape[0])
+			print( f"  end using   (left,right,top,bottom) = ({left},{right},{top},{bottom})" )
 			# 
 			w = A.shape[1] - left - right
 			h = A.shape[0] - top - bottom
@@ -656,11 +993,11 @@ class MainWindow(QMainWindow):
 					self.prevPixmap = self.pixmap 
 					if (len(A.shape) == 3) and (A.shape[2] >= 3):  # color img
 						print("cropImage(): Crop color")
-						B = A[top:top+w,left:left+w,:].copy() 
+						B = np.ascontiguousarray(A[top:top+h,left:left+w,:])
 						self.np2image2pixmap(B, numpyAlso=True)
 					else:
 						print("cropImage(): Crop gray")
-						B = A[top:top+w,left:left+w].copy()
+						B = np.ascontiguousarray(A[top:top+h,left:left+w])
 						self.np2image2pixmap(B, numpyAlso=True)
 					self.setWindowTitle( f"{self.appFileName} : Black frame cut from image" )
 					self.setIsAllGray()
@@ -698,12 +1035,11 @@ class MainWindow(QMainWindow):
 		"""Convert the current numpy color image into a gray scale image
 		and copy (move) it back to current pixmap
 		"""
-		if (len(self.npImage.shape) == 3) and (self.npImage.shape[2] >= 3):
+		if (len(self.npImage.shape) == 3) and (self.npImage.shape[2] in _toGrayCode):
 			self.prevPixmap = self.pixmap
-			if (self.npImage.shape[2] == 3):
-				B = cv2.cvtColor(self.npImage, cv2.COLOR_BGR2GRAY)
-			if (self.npImage.shape[2] == 4):
-				B = cv2.cvtColor(self.npImage, cv2.COLOR_BGRA2GRAY)
+			B = self._getGray()
+			if B is self._grayBuf:
+				self._grayBuf = None   # B is now npImage (and memory of self.image), it is not written into again
 			self.np2image2pixmap(B, numpyAlso=True)
 			self.setWindowTitle( f"{self.appFileName} : gray scale image" )
 		else:
@@ -720,24 +1056,38 @@ class MainWindow(QMainWindow):
 		"""This method may be started from the edge dialog 
 		to (quickly) show results of new edge filter values.
 		"""
-		B = self.npImage
-		# B = cv2.GaussianBlur(B, 11, 2.5)  # sizeK and sigma ??
-		# Eh = cv2.Sobel(B, ddepth=cv2.CV_16S, dx=0, dy=1, ksize=valK)
-		# Ev = cv2.Sobel(B, ddepth=cv2.CV_16S, dx=1, dy=0, ksize=valK)
-		# Eh = Eh.astype(np.float32)
-		# Ev = Ev.astype(np.float32) 
-		Eh = cv2.Sobel(B, ddepth=cv2.CV_32F, dx=0, dy=1, ksize=valK)
-		Ev = cv2.Sobel(B, ddepth=cv2.CV_32F, dx=1, dy=0, ksize=valK)
-		# print( f"tryEdges: Eh is an array of {Eh.dtype.name}, shape {str(Eh.shape)}" )
-		B = np.sqrt( 1 + np.power(Eh,2) + np.power(Ev,2) )
-		# B = cv2.Sobel(B, ddepth=cv2.CV_16S, dx=1, dy=1, ksize=valK)  # hmmm
-		if (valS > 1):
-			a = smoothFilter(len=valS)
-			B = cv2.sepFilter2D(B, ddepth=-1, kernelX=a, kernelY=a)
-		B = np.floor(B * (255/np.max(B))).astype(np.uint8)
-		self.np2image2pixmap(B, numpyAlso=False)   # note: self.npImage is not updated
+		# the work is done in a thread, one job at a time, and the result is shown by showEdges()
+		# values given while a job is running wait, and only the latest of them are used
+		self.edgeJobId += 1
+		self.edgePending = (valK, valS)
+		if not self.edgeRunning:
+			self.startEdgeJob()
 		return
 	#end function tryEdges()
+	
+	def startEdgeJob(self):
+		"""Start an edge job in 'self.edgePool' for the values in 'self.edgePending'."""
+		(valK, valS) = self.edgePending
+		self.edgePending = None
+		self.edgeRunning = True
+		worker = Worker(self.edgeJobId, _edgeImage, self.npImage, valK, valS)
+		worker.signals.done.connect(self.showEdges)
+		self.edgePool.start(worker)
+		return
+		
+	def showEdges(self, jobId, B):
+		"""Show edge image 'B' made by a tryEdges() worker, unless newer values are given, 
+		then a job for the latest values is started instead.
+		"""
+		self.edgeRunning = False
+		if isinstance(B, Exception):   # the job failed, Worker gives the exception as result
+			print( f"showEdges: edge job {jobId} failed:" )
+			traceback.print_exception(type(B), B, B.__traceback__)
+		if self.edgePending is not None:
+			self.startEdgeJob()
+		elif (jobId == self.edgeJobId) and (not isinstance(B, Exception)):
+			self.np2image2pixmap(B, numpyAlso=False)   # note: self.npImage is not updated
+		return
 		
 	def toEdges(self):
 		"""Show the edge dialog, and process the (gray scale) image 
@@ -748,18 +1098,15 @@ class MainWindow(QMainWindow):
 		B = self.npImage
 		oldPixmap = self.prevPixmap
 		self.prevPixmap = self.pixmap
-		d = EdgeDialog(parent=self)   # create object (but does not run it)
+		if self.edgeDlg is None:
+			self.edgeDlg = EdgeDialog(parent=self)   # create object (but does not run it)
+		d = self.edgeDlg
 		(valK,valS) = d.getValues()   # display dialog and return values
+		self.edgeJobId += 1   # results from tryEdges() workers still running are not shown
+		self.edgePending = None
+		self.edgePool.waitForDone()   # edge job (numba and OpenCV threads) is not run twice at the same time
 		if d.result():   # 1 if accepted (OK), 0 if rejected (Cancel)
-			Eh = cv2.Sobel(B, ddepth=cv2.CV_32F, dx=0, dy=1, ksize=valK)
-			Ev = cv2.Sobel(B, ddepth=cv2.CV_32F, dx=1, dy=0, ksize=valK)
-			B = np.sqrt( 1 + np.power(Eh,2) + np.power(Ev,2) )
-			if (valS > 1):
-				a = smoothFilter(len=valS)
-				B = cv2.sepFilter2D(B, ddepth=-1, kernelX=a, kernelY=a)
-			# print( f"toEdges: B is an array of {B.dtype.name}, shape {str(B.shape)}" )
-			# print( f"         min(B) {np.min(B):8.2f},  max(B) {np.max(B):8.2f}" )
-			B = np.floor(B * (255/np.max(B))).astype(np.uint8)
+			B = _edgeImage(B, valK, valS)
 			self.np2image2pixmap(B, numpyAlso=True)
 			self.setWindowTitle( "{self.appFileName} : edge image" )
 		else:
@@ -776,15 +1123,15 @@ class MainWindow(QMainWindow):
 		"""This method may be started from the filter dialog 
 		to (quickly) show results of new filter values.
 		"""
-		if (len(h) > 1):
-			B = cv2.filter2D(self.npImage, ddepth=cv2.CV_16S, kernel=h).astype(np.float32) 
+		A = self.npImage
+		maxPreview = 720   # filter a smaller image when the preview is made, OK filters full size
+		s = maxPreview / max(A.shape[:2])
+		# a small image, filtering bands in threads takes more time than it saves
+		if (s < 1.0) and ((len(h) > 1) or (valS > 1)):
+			B = _filterImage(cv2.resize(A, None, fx=s, fy=s, interpolation=cv2.INTER_AREA), h, valS, parallel=False)
+			B = cv2.resize(B, (A.shape[1], A.shape[0]), interpolation=cv2.INTER_NEAREST)   # same size as pixmap 
 		else:
-			B = self.npImage.astype(np.float32)
-		if (valS > 1):
-			a = smoothFilter(len=valS)
-			B = cv2.sepFilter2D(B, ddepth=-1, kernelX=a, kernelY=a)
-		B = B - np.min(B)
-		B = np.floor(B * (255/np.max(B))).astype(np.uint8)
+			B = _filterImage(A, h, valS, parallel=False)
 		self.np2image2pixmap(B, numpyAlso=False)   # note: self.npImage is not updated
 		return
 	#end function tryFilter()
@@ -798,18 +1145,13 @@ class MainWindow(QMainWindow):
 		B = self.npImage
 		oldPixmap = self.prevPixmap
 		self.prevPixmap = self.pixmap   
-		d = FilterDialog(parent=self)   # create object (but does not run it)
+		if self.filterDlg is None:
+			self.filterDlg = FilterDialog(parent=self)   # create object (but does not run it)
+		d = self.filterDlg
 		(h,valS) = d.getValues()   # display dialog and return values
 		if d.result():   # 1 if accepted (OK), 0 if rejected (Cancel)
-			if (len(h) > 1):
-				B = cv2.filter2D(B, ddepth=cv2.CV_16S, kernel=h).astype(np.float32)
-			else:
-				B = self.npImage.astype(np.float32)
-			if (valS > 1):
-				a = smoothFilter(len=valS)
-				B = cv2.sepFilter2D(B, ddepth=-1, kernelX=a, kernelY=a)
-			B = B - np.min(B)
-			B = np.floor(B * (255/np.max(B))).astype(np.uint8)
+			B = _filterImage(B, h, valS)
+		if d.result() and (B is not self.npImage):   # else the image is not changed
 			self.np2image2pixmap(B, numpyAlso=True)
 			self.setWindowTitle( f"{self.appFileName} : filtered image" ) 
 		else:
@@ -827,11 +1169,13 @@ class MainWindow(QMainWindow):
 		to (quickly) show results of threshold 't'.
 		"""
 		B = self.npImage
+		if (self.binBuf is None) or (self.binBuf.shape != B.shape) or (self.binBuf.dtype != B.dtype):
+			self.binBuf = np.empty_like(B)   # pixmap is a copy, so the same buffer can be used again
 		if (t < 2):
-			(used_thr,B) = cv2.threshold(B, thresh=1, maxval=255, type=cv2.THRESH_OTSU)
+			(used_thr,B) = cv2.threshold(B, thresh=1, maxval=255, type=cv2.THRESH_OTSU, dst=self.binBuf)
 			print( f"tryBinary: The used Otsu threshold value is {used_thr}" ) 
 		else:
-			(used_thr,B) = cv2.threshold(B, thresh=t, maxval=255, type=cv2.THRESH_BINARY)
+			(used_thr,B) = cv2.threshold(B, thresh=t, maxval=255, type=cv2.THRESH_BINARY, dst=self.binBuf)
 		#
 		self.np2image2pixmap(B, numpyAlso=False)   # note: self.npImage is not updated
 		return
@@ -846,7 +1190,9 @@ class MainWindow(QMainWindow):
 		B = self.npImage
 		oldPixmap = self.prevPixmap
 		self.prevPixmap = self.pixmap   
-		d = ThresholdDialog(parent=self)   # create object (but does not run it)
+		if self.thresholdDlg is None:
+			self.thresholdDlg = ThresholdDialog(parent=self)   # create object (but does not run it)
+		d = self.thresholdDlg
 		t = d.getValues()   # display dialog and return values
 		if d.result():   # 1 if accepted (OK), 0 if rejected (Cancel)
 			if (t < 2):
@@ -913,15 +1259,15 @@ class MainWindow(QMainWindow):
 		cv2.destroyAllWindows()
 	
 	def ConvertToGray(self):
-		gray_image = cv2.cvtColor(self.npImage, cv2.COLOR_BGR2GRAY)
+		gray_image = self._getGray()
 		cv2.imshow('Image Window', gray_image)
 		cv2.waitKey(10000)
 		cv2.destroyAllWindows()
   
 	def histogramGray(self):
-		gray_image = cv2.cvtColor(self.npImage, cv2.COLOR_BGR2GRAY)
+		gray_image = self._getGray()
 		hist = cv2.calcHist([gray_image], [0], None, [256], [0, 256])
-		hist = hist / hist.sum()
+		cv2.normalize(hist, hist, alpha=1.0, beta=0.0, norm_type=cv2.NORM_L1)   # sum is 1, in place
 		plt.figure(figsize=(10, 6))
 		plt.title("Histogram of the image in gray scale")
 		plt.xlabel("Intensity of pixel")
@@ -936,16 +1282,15 @@ class MainWindow(QMainWindow):
 		if self.npImage is None or not isinstance(self.npImage, np.ndarray):
 			print("No valid image loaded.")
 			return
-		if len(self.npImage.shape) == 3 and self.npImage.shape[2] == 3:
-			gray_image = cv2.cvtColor(self.npImage, cv2.COLOR_BGR2GRAY)
-		elif len(self.npImage.shape) == 3 and self.npImage.shape[2] == 4:
-			gray_image = cv2.cvtColor(self.npImage, cv2.COLOR_BGRA2GRAY)
+		gray_image = self._getGray()
+		(sobel_y, sobel_x) = _edgeGradients(gray_image, 3)   # int16 for a uint8 image
+		if numbaOK:   # magnitude and scaling to uint8 in one kernel
+			sobel_magnitude = np.empty(sobel_x.shape, dtype=np.uint8)
+			_gradMagU8(sobel_x, sobel_y, 0.0, sobel_magnitude)
 		else:
-			gray_image = self.npImage  
-		sobel_x = cv2.Sobel(gray_image, cv2.CV_64F, 1, 0, ksize=3)
-		sobel_y = cv2.Sobel(gray_image, cv2.CV_64F, 0, 1, ksize=3)
-		sobel_magnitude = np.sqrt(sobel_x**2 + sobel_y**2)
-		sobel_magnitude = np.uint8(255 * sobel_magnitude / np.max(sobel_magnitude))
+			sobel_magnitude = cv2.magnitude(sobel_x.astype(np.float32, copy=False), 
+											sobel_y.astype(np.float32, copy=False))
+			sobel_magnitude = cv2.normalize(sobel_magnitude, None, alpha=255, norm_type=cv2.NORM_INF, dtype=cv2.CV_8U)
 		self.np2image2pixmap(sobel_magnitude, numpyAlso=True)
 		self.setWindowTitle(f"{self.appFileName} : Sobel edge emphasized image")
 		print("Edges emphasized using the Sobel filter.")
@@ -957,36 +1302,31 @@ class MainWindow(QMainWindow):
 				print("No valid image loaded.")
 				return
 			max_dim = 1000
-			if max(self.npImage.shape[:2]) > max_dim:
-				scale_factor = max_dim / max(self.npImage.shape[:2])
-				self.npImage = cv2.resize(self.npImage, (0, 0), fx=scale_factor, fy=scale_factor)
-				print(f"Image resized to {self.npImage.shape[1]}x{self.npImage.shape[0]} for performance reasons.")
-			if len(self.npImage.shape) == 3 and self.npImage.shape[2] == 3:
-				gray_image = cv2.cvtColor(self.npImage, cv2.COLOR_BGR2GRAY)
-			elif len(self.npImage.shape) == 3 and self.npImage.shape[2] == 4:
-				gray_image = cv2.cvtColor(self.npImage, cv2.COLOR_BGRA2GRAY)
-			else:
-				gray_image = self.npImage  
-			gray_image = np.float32(gray_image)
+			gray_image = self._getGrayF32()
+			scale_factor = min(1.0, max_dim / max(gray_image.shape[:2]))
+			if (scale_factor < 1.0):   # find corners on a smaller (local) copy, npImage is not changed
+				gray_image = cv2.resize(gray_image, (0, 0), fx=scale_factor, fy=scale_factor, 
+						interpolation=cv2.INTER_AREA)
+				print(f"Harris corners are found on a {gray_image.shape[1]}x{gray_image.shape[0]} image for performance reasons.")
 			harris_response = cv2.cornerHarris(gray_image, blockSize=2, ksize=3, k=0.04)
 			harris_response = cv2.dilate(harris_response, None)
 			if len(self.npImage.shape) == 2:  
-				self.npImage = cv2.cvtColor(self.npImage, cv2.COLOR_GRAY2BGR)
+				img = cv2.cvtColor(self.npImage, cv2.COLOR_GRAY2BGR)
+			else:
+				img = self.npImage.copy()   # draw on a copy, npImage is not changed
+			color = (0, 0, 255, 255) if (img.shape[2] == 4) else (0, 0, 255)
 			threshold_value = 0.01 * harris_response.max()
-			corner_count = 0
-			for y in range(harris_response.shape[0]):
-				for x in range(harris_response.shape[1]):
-					if harris_response[y, x] > threshold_value:
-						if corner_count < 1000:  
-							x_int, y_int = int(x), int(y)
-							try:
-								cv2.circle(self.npImage, (x_int, y_int), 5, (0, 0, 255), 1)  
-								corner_count += 1
-							except Exception as e:
-								print(f"Error drawing circle at ({x_int}, {y_int}): {e}")
-						else:
-							break
-			self.np2image2pixmap(self.npImage, numpyAlso=False)
+			coords = np.argwhere(harris_response > threshold_value)[:1000]   # (y,x), row by row, at most 1000
+			coords = np.minimum((coords / scale_factor).astype(int), np.array(img.shape[:2]) - 1)   # back to pixels in npImage
+			# draw all circles at once: dilate the corner points by a ring (a circle with radius 5)
+			ring = np.zeros((11, 11), dtype=np.uint8)
+			cv2.circle(ring, (5, 5), 5, 1, 1)  
+			mask = np.zeros(img.shape[:2], dtype=np.uint8)
+			mask[coords[:,0], coords[:,1]] = 255
+			mask = cv2.dilate(mask, ring)
+			img[mask > 0] = color
+			corner_count = len(coords)
+			self.np2image2pixmap(img, numpyAlso=False)   # note: self.npImage is not updated
 			self.setWindowTitle(f"{self.appFileName} : Harris Corner Detection")
 			print(f"Corners detected using Harris Corner Detection: {corner_count} corners displayed.")
 			self.setMenuItems()
@@ -1000,15 +1340,17 @@ class MainWindow(QMainWindow):
 			self.setWindowTitle( f"{self.appFileName} : image where Red and Blue components are swapped" )
 		else:
 			print( "swapRandB: npImage is not an RGB/BGR image, swap black and white." )
-			B =  255 - self.npImage
+			if (self.npImage.dtype == np.uint8):
+				B = cv2.bitwise_not(self.npImage)   # same as 255 - npImage for uint8
+			else:
+				B =  255 - self.npImage
 			self.np2image2pixmap(B, numpyAlso=True)
 			self.setWindowTitle( f"{self.appFileName} : image where black and white are swapped" )
 		self.setMenuItems()  
 		return
 
 	def drawlines(self):
-		img = self.npImage
-		gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+		gray = self._getGray()
 		edges = cv2.Canny(gray, 50, 150, apertureSize=3)
 		lines = cv2.HoughLines(edges, 1, np.pi/180, 200)
 		
@@ -1016,26 +1358,24 @@ class MainWindow(QMainWindow):
 		img_bgr = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
 
 		if lines is not None:
-			for line in lines:
-				rho, theta = line[0]
-				a = np.cos(theta)
-				b = np.sin(theta)
-				x0 = a * rho
-				y0 = b * rho
-				x1 = int(x0 + 1000 * (-b))
-				y1 = int(y0 + 1000 * (a))
-				x2 = int(x0 - 1000 * (-b))
-				y2 = int(y0 - 1000 * (a))
-				cv2.line(img_bgr, (x1, y1), (x2, y2), (0, 0, 255), 2)  # Red color (BGR)
+			# end points for all lines at once, (rho,theta) are in lines[:,0,:]
+			(rho, theta) = (lines[:,0,0], lines[:,0,1])
+			a = np.cos(theta)
+			b = np.sin(theta)
+			x0 = a * rho
+			y0 = b * rho
+			x1 = (x0 + 1000 * (-b)).astype(np.int32)
+			y1 = (y0 + 1000 * (a)).astype(np.int32)
+			x2 = (x0 - 1000 * (-b)).astype(np.int32)
+			y2 = (y0 - 1000 * (a)).astype(np.int32)
+			for i in range(len(rho)):
+				cv2.line(img_bgr, (int(x1[i]), int(y1[i])), (int(x2[i]), int(y2[i])), (0, 0, 255), 2)  # Red color (BGR)
 
 		self.np2image2pixmap(img_bgr, numpyAlso=False)
 		self.setWindowTitle(f"{self.appFileName}: Draw Lines")
 
-	def rotate_90_clockwise(matrix):
-		return [list(reversed(col)) for col in zip(*matrix)]
-
 	def rotate_image(self):
-		rotated_image = self.rotate_90_clockwise(self.npImage)
+		rotated_image = cv2.rotate(self.npImage, cv2.ROTATE_90_CLOCKWISE)   # contiguous copy, ok for QImage
 		self.np2image2pixmap(rotated_image, numpyAlso=True)
 		self.setWindowTitle(f"{self.appFileName} : Rotated Image")
 		self.setMenuItems()
@@ -53,10 +53,10 @@ from time import sleep
 import cv2
 
 try:
-	from PyQt5.QtCore import Qt, QPoint, QRectF, QT_VERSION_STR
+	from PyQt5.QtCore import Qt, QPoint, QRectF, QT_VERSION_STR, QThreadPool
 	from PyQt5.QtGui import QImage, QPixmap, QTransform
 	from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QFileDialog, QLabel, 
-			QGraphicsScene, QGraphicsPixmapItem)
+			QGraphicsScene)
 except ImportError:
 	raise ImportError( f"{_appFileName}: Requires PyQt5." )
 #end try, import PyQt5 classes
@@ -72,8 +72,17 @@ except ImportError:
 	ueyeOK = False   # --> may run program even without pyueye
 #end try, import pyueye
 
-from appImageViewer1O import myPath, MainWindow as inheritedMainWindow 
-from files.myImageTools import np2qimage
+from appImageViewer1O import myPath, Worker, MainWindow as inheritedMainWindow 
+
+_eyeRadius = (5, 30)   # (min, max) radius in pixels of a dice eye in a 720x1280 camera image, used by houghCircles()
+_eyeImageHeight = 720  # height of the image '_eyeRadius' is for, the radius is scaled for other image heights
+
+def _waitForImage(cam, imBuf):
+	"""Capture one image into 'imBuf' and return retVal, this may block up to 1 s and is run by a Worker."""
+	cam.freeze_video(True)
+	# function below obsolete in UDS 4.95 -->
+	# use is_ImageQueue(), see: https://en.ids-imaging.com/release-note/release-notes-ids-software-suite-4-95.html
+	return ueye.is_WaitForNextImage(cam.handle(), 1000, imBuf.mem_ptr, imBuf.mem_id)
 
 class MainWindow(inheritedMainWindow):  
 	"""MainWindow class for this image viewer is inherited from another image viewer."""
@@ -94,6 +103,15 @@ class MainWindow(inheritedMainWindow):
 		# 
 		self.cam = None
 		self.camOn = False
+		self.numCamBuffers = 8       # number of image buffers allocated in cameraOn()
+		self.camSubSampling = False  # True for 2x2 subsampling in camera, images are then 360x640, see cameraOn()
+		self.camCaps = {}            # camera values that do not change, see readCameraCaps()
+		self.capturing = False       # true while a Worker waits for a camera image
+		self.captureJobId = 0        # id of last capture job, see showCameraImage()
+		self.imBuf = None            # ImageBuffer made in cameraOn(), and used for all captures
+		self.npCamImage = None       # numpy array the camera images are copied into, see copy_image()
+		self.circles = None          # circles found by houghCircles() in npImage
+		self.circlesVersion = -1     # self._imgVersion when self.circles was found
 		#
 		# I had some trouble finding a good way to inherit (and add modifications to) 
 		# functions 'initMenu' and 'setMenuItems' from appImageViewer1
@@ -123,6 +141,12 @@ class MainWindow(inheritedMainWindow):
 		a = self.qaCameraOff = QAction('Camera off', self)
 		a.triggered.connect(self.cameraOff)
 		#
+		a = self.qaCamSubSampling = QAction('Camera 2x2 subsampling', self)
+		a.setCheckable(True)
+		a.setChecked(self.camSubSampling)
+		a.setToolTip('Use 2x2 subsampling (360x640 images) when camera is turned on.')
+		a.toggled.connect(self.setCamSubSampling)
+		#
 		a = self.qanewcamerafunction = QAction('New camera function', self)
 		a.triggered.connect(self.newCameraFunction)
 		#
@@ -141,6 +165,7 @@ class MainWindow(inheritedMainWindow):
 		camMenu.addAction(self.qaGetOneImage)
 		camMenu.addAction(self.qaGetOneImageV2)
 		camMenu.addAction(self.qaCameraOff)
+		camMenu.addAction(self.qaCamSubSampling)
 		camMenu.addAction(self.qanewcamerafunction)
 		# print( "File {_appFileName}: (debug) last line in initMenu2()" ) 
 		diceMenu = self.mainMenu.addMenu('&Dice')
@@ -160,16 +185,27 @@ class MainWindow(inheritedMainWindow):
 		# self.setMenuItems() 
 		self.qaCameraOn.setEnabled(ueyeOK and (not self.camOn))
 		self.qaCameraInfo.setEnabled(ueyeOK and self.camOn)
-		self.qaGetOneImage.setEnabled(ueyeOK and self.camOn)
-		self.qaGetOneImageV2.setEnabled(ueyeOK and self.camOn)
-		self.qaCameraOff.setEnabled(ueyeOK and self.camOn)
+		self.qaGetOneImage.setEnabled(ueyeOK and self.camOn and (not self.capturing))
+		self.qaGetOneImageV2.setEnabled(ueyeOK and self.camOn and (not self.capturing))
+		self.qaCameraOff.setEnabled(ueyeOK and self.camOn and (not self.capturing))
+		self.qaCamSubSampling.setEnabled(ueyeOK and (not self.camOn))   # used when camera is turned on
 		return
 		
 	def copy_image(self, image_data):
 		"""Copy an image from camera memory to numpy image array 'self.npImage'."""
 		tempBilde = image_data.as_1d_image()
-		if np.min(tempBilde) != np.max(tempBilde):
-			self.npImage = np.copy(tempBilde[:,:,[0,1,2]])  # or [2,1,0] ??  RGB or BGR?
+		A = tempBilde.reshape(tempBilde.shape[0], -1)   # a 2D view, cv2.minMaxLoc() needs one channel
+		(lo, hi) = (A[::16,::256].min(), A[::16,::256].max())   # a few samples are enough for most images
+		if (lo == hi): 
+			(lo, hi) = cv2.minMaxLoc(A)[:2]   # one pass through all pixels
+		if (lo != hi):
+			# the camera gives BGR (IS_CM_BGR8_PACKED), as OpenCV and npImage use, so no channel reordering,
+			# and when there are just 3 channels the whole (contiguous) buffer is copied in one memcpy
+			src = tempBilde if (tempBilde.shape[2] == 3) else tempBilde[:,:,:3]
+			if (self.npCamImage is None) or (self.npCamImage.shape != src.shape):
+				self.npCamImage = np.empty(src.shape, dtype=np.uint8)   # made once, reused for the next images
+			np.copyto(self.npCamImage, src)
+			self.npImage = self.npCamImage
 			print( ("copy_image(): 'self.npImage' is an ndarray" + 
 					f" of {self.npImage.dtype.name}, shape {str(self.npImage.shape)}.") )
 		else: 
@@ -178,6 +214,21 @@ class MainWindow(inheritedMainWindow):
 		image_data.unlock()  # important action
 		return 
 		
+	def showNpImage(self, title):
+		"""Show 'self.npImage' as pixmap on scene, and 'title' in window title.
+		Note that npImage is set again, thus it is marked as changed (self._imgVersion).
+		"""
+		# function defined in appImageViewer1.py, self.image uses the memory of npImage (no copy)
+		self.np2image2pixmap(self.npImage, numpyAlso=True)
+		if self.image.isNull():
+			self.pixmap = QPixmap()
+			return
+		self.setWindowTitle( f"{self.appFileName} : {title}" ) 
+		(w,h) = (self.pixmap.width(), self.pixmap.height())
+		self.status.setText( f"pixmap: (w,h) = ({w},{h})" )
+		self.scaleOne()
+		return
+		
 # Methods for actions on the Camera-menu
 # dette gir ikke samme muligheter som IDS program, autofokus for XS kamera virker ikke her
 	def cameraOn(self):
@@ -186,15 +237,48 @@ class MainWindow(inheritedMainWindow):
 			self.cam = Camera()
 			self.cam.init()  # gives error when camera not connected
 			self.cam.set_colormode(ueye.IS_CM_BGR8_PACKED)
+			(h, w) = (720, 1280)
+			if self.camSubSampling:   # a quarter of the pixels to transfer and process
+				# dice eyes are then half the radius given in '_eyeRadius', houghCircles() scales it
+				retVal = ueye.is_SetSubSampling(self.cam.handle(), 
+						ueye.IS_SUBSAMPLING_2X_VERTICAL | ueye.IS_SUBSAMPLING_2X_HORIZONTAL)
+				if retVal == ueye.IS_SUCCESS:
+					(h, w) = (h//2, w//2)
+				else:
+					print( f"{self.appFileName}: cameraOn() subsampling not supported, retVal = {retVal}" )
 			# This function is currently not supported by the camera models USB 3 uEye XC and XS.
-			self.cam.set_aoi(0, 0, 720, 1280)  # but this is the size used
-			self.cam.alloc(3)  # argument is number of buffers
+			self.cam.set_aoi(0, 0, h, w)  # but this is the size used
+			# argument is number of buffers, more buffers keep more USB transfers going, 
+			# each buffer is 720*1280*3 bytes (2.6 MB), so 8 buffers use about 22 MB
+			self.cam.alloc(self.numCamBuffers)
+			self.imBuf = ImageBuffer()  # used to get return pointers, the same one for each image
+			self.readCameraCaps()
 			self.camOn = True
 			self.setMenuItems2()
 			print( f"{self.appFileName}: cameraOn() Camera started ok" )
 		#
 		return
 	
+	def setCamSubSampling(self, checked):
+		"""Set if 2x2 subsampling should be used, it is used from the next time the camera is turned on."""
+		self.camSubSampling = bool(checked)
+		return
+		
+	def readCameraCaps(self):
+		"""Read camera values that do not change (default exposure and focus capabilities) into 'self.camCaps'.
+		This is done once, in cameraOn(), and printCameraInfo() prints them from there.
+		The exposure range depends on the frame rate, so it is read in printCameraInfo().
+		"""
+		d = ueye.double()
+		ui1 = ueye.uint()
+		self.camCaps = {}
+		if ueye.is_Exposure(self.cam.handle(), ueye.IS_EXPOSURE_CMD_GET_EXPOSURE_DEFAULT, d, 8) == ueye.IS_SUCCESS:
+			self.camCaps['expDefault'] = float(d)
+		retVal = ueye.is_Focus(self.cam.handle(), ueye.FDT_CMD_GET_CAPABILITIES, ui1, 4)
+		self.camCaps['focusRetVal'] = retVal
+		self.camCaps['focusCaps'] = int(ui1)
+		return
+		
 	def printCameraInfo(self):
 		"""Print some information on camera."""
 		if ueyeOK and self.camOn:
@@ -207,26 +291,22 @@ class MainWindow(inheritedMainWindow):
 			retVal = ueye.is_SetFrameRate(self.cam.handle(), 2.0, d)
 			if retVal == ueye.IS_SUCCESS:
 				print( f"  frame rate set to                      {float(d):8.3f} fps" )
-			retVal = ueye.is_Exposure(self.cam.handle(), 
-									  ueye.IS_EXPOSURE_CMD_GET_EXPOSURE_DEFAULT, d, 8)
-			if retVal == ueye.IS_SUCCESS:
-				print( f"  default setting for the exposure time  {float(d):8.3f} ms" )
-			retVal = ueye.is_Exposure(self.cam.handle(), 
-									  ueye.IS_EXPOSURE_CMD_GET_EXPOSURE_RANGE_MIN, d, 8)
+			caps = self.camCaps   # read in cameraOn(), these do not change
+			if 'expDefault' in caps:
+				print( f"  default setting for the exposure time  {caps['expDefault']:8.3f} ms" )
+			# the exposure range depends on the frame rate, so it is read after the frame rate is set
+			retVal = ueye.is_Exposure(self.cam.handle(), ueye.IS_EXPOSURE_CMD_GET_EXPOSURE_RANGE_MIN, d, 8)
 			if retVal == ueye.IS_SUCCESS:
 				print( f"  minimum exposure time                  {float(d):8.3f} ms" )
-			retVal = ueye.is_Exposure(self.cam.handle(), 
-									  ueye.IS_EXPOSURE_CMD_GET_EXPOSURE_RANGE_MAX, d, 8)
+			retVal = ueye.is_Exposure(self.cam.handle(), ueye.IS_EXPOSURE_CMD_GET_EXPOSURE_RANGE_MAX, d, 8)
 			if retVal == ueye.IS_SUCCESS:
 				print( f"  maximum exposure time                  {float(d):8.3f} ms" )
 			# 
-			print( f"  sys.getsizeof(d) returns   {sys.getsizeof(d)}  (??)" )
-			print( f"  sys.getsizeof(ui1) returns {sys.getsizeof(ui1)}  (??)" )
-			retVal = ueye.is_Focus(self.cam.handle(), ueye.FDT_CMD_GET_CAPABILITIES, ui1, 4)
-			if ((retVal == ueye.IS_SUCCESS) and (ui1 & ueye.FOC_CAP_AUTOFOCUS_SUPPORTED)):
+			retVal = caps['focusRetVal']
+			if ((retVal == ueye.IS_SUCCESS) and (caps['focusCaps'] & ueye.FOC_CAP_AUTOFOCUS_SUPPORTED)):
 				print( "  autofocus supported" )
 			if retVal == ueye.IS_SUCCESS:
-				print( f"  is_Focus() is success          ui1 = {ui1}" )
+				print( f"  is_Focus() is success          ui1 = {caps['focusCaps']}" )
 			else:
 				print( f"  is_Focus() is NOT success   retVal = {retVal}" )
 			fZR = ueye.IS_RECT()   # may be used to set focus ??
@@ -237,13 +317,11 @@ class MainWindow(inheritedMainWindow):
 			if retVal == ueye.IS_SUCCESS:
 				print( f"  is_Focus( STATUS ) is success  ui1 = {ui1}" )
 			# her slutter det jeg testet ekstra i 2021
-			retVal = ueye.is_Exposure(self.cam.handle(), ueye.IS_EXPOSURE_CMD_GET_EXPOSURE, d, 8)
-			if retVal == ueye.IS_SUCCESS:
-				print( f"  currently set exposure time            {float(d):8.3f} ms" )
 			d =  ueye.double(5.0)
 			retVal = ueye.is_Exposure(self.cam.handle(), ueye.IS_EXPOSURE_CMD_SET_EXPOSURE, d, 8)
 			if retVal == ueye.IS_SUCCESS:
 				print( f"  tried to changed exposure time to      {float(d):8.3f} ms" )
+			# only the exposure time after the change is read from camera
 			retVal = ueye.is_Exposure(self.cam.handle(), ueye.IS_EXPOSURE_CMD_GET_EXPOSURE, d, 8)
 			if retVal == ueye.IS_SUCCESS:
 				print( f"  currently set exposure time            {float(d):8.3f} ms" )
@@ -252,100 +330,71 @@ class MainWindow(inheritedMainWindow):
 		
 	def getOneImageV2(self):
 		"""Get one image from IDS camera, version 2, autumn 2022."""
-		if not(ueyeOK and self.camOn): 
+		if not(ueyeOK and self.camOn and (not self.capturing)): 
 			# pass  # ignore action
 			#else:  
 			return
 		#
-		self.view.setMouseTracking(False)
 		print( f"{self.appFileName}: getOneImageV2() try to capture one image" )
-		imBuf = ImageBuffer()  # used to get return pointers
-		self.cam.freeze_video(True)
 		# some sleep does not help
 		# sleep(2.5)
 		# self.cam.freeze_video(False)
 		# sleep(2.5)
 		# self.cam.freeze_video(True)
-		# function below obsolete in UDS 4.95 -->
-		# use is_ImageQueue(), see: https://en.ids-imaging.com/release-note/release-notes-ids-software-suite-4-95.html
-		retVal = ueye.is_WaitForNextImage(self.cam.handle(), 1000, imBuf.mem_ptr, imBuf.mem_id)
-		if retVal == ueye.IS_SUCCESS:
+		self.startCapture()
+		return
+	
+	def getOneImage(self):
+		"""Get one image from IDS camera."""
+		if ueyeOK and self.camOn and (not self.capturing):
+			print( f"{self.appFileName}: getOneImage() try to capture one image" )
+			self.startCapture()
+		#else:  
+		#	pass  # ignore action
+		return
+		
+	def startCapture(self):
+		"""Wait for the next camera image in a thread from the pool, so the GUI is not blocked,
+		the image is then shown by showCameraImage()."""
+		self.capturing = True
+		self.setMenuItems2()   # no new capture (or camera off) until this one is done
+		self.captureJobId += 1
+		worker = Worker(self.captureJobId, _waitForImage, self.cam, self.imBuf)
+		worker.signals.done.connect(self.showCameraImage)
+		QThreadPool.globalInstance().start(worker)
+		return
+		
+	def showCameraImage(self, jobId, retVal):
+		"""Show the image captured by a startCapture() worker, 'retVal' is from is_WaitForNextImage(),
+		or the exception raised in the worker (ex. camera unplugged).
+		"""
+		if (jobId != self.captureJobId):
+			return
+		self.capturing = False
+		imBuf = self.imBuf
+		if isinstance(retVal, Exception):
+			print( f"{self.appFileName}: getOneImage() error {retVal!r}" )
+			self.setWindowTitle( f"{self.appFileName}: getOneImage() error {retVal}" )
+		elif retVal == ueye.IS_SUCCESS:
 			print( f"  ueye.IS_SUCCESS: image buffer id = {imBuf.mem_id}" )
 			self.copy_image( ImageData(self.cam.handle(), imBuf) )  # copy image_data 
 			if (self.npImage.size > 0): # ok 
-				self.image = np2qimage(self.npImage)
-				if (not self.image.isNull()):
-					self.pixmap = QPixmap.fromImage(self.image)
-					if self.curItem: 
-						self.scene.removeItem(self.curItem)
-					self.curItem = QGraphicsPixmapItem(self.pixmap)
-					self.scene.addItem(self.curItem)
-					self.scene.setSceneRect(0, 0, self.pixmap.width(), self.pixmap.height())
-					self.setWindowTitle( f"{self.appFileName} : Camera image" ) 
-					(w,h) = (self.pixmap.width(), self.pixmap.height())
-					self.status.setText( f"pixmap: (w,h) = ({w},{h})" )
-					self.scaleOne()
-					self.view.setMouseTracking(True)
-				else:
-					self.pixmap = QPixmap()
-				#end
+				self.showNpImage("Camera image")
 			else:  # empty image self.npImage
 				self.image = QImage()
 				self.pixmap = QPixmap()
 				print( "  no image in buffer " + str(imBuf) )
 			#
 		else: 
-			self.setWindowTitle( "{self.appFileName}: getOneImage() error retVal = {retVal}" )
+			self.setWindowTitle( f"{self.appFileName}: getOneImage() error retVal = {retVal}" )
 		#end if
 		self.setIsAllGray()
 		self.setMenuItems2()
 		return
-	
-	def getOneImage(self):
-		"""Get one image from IDS camera."""
-		if ueyeOK and self.camOn:
-			self.view.setMouseTracking(False)
-			print( f"{self.appFileName}: getOneImage() try to capture one image" )
-			imBuf = ImageBuffer()  # used to get return pointers
-			self.cam.freeze_video(True)
-			retVal = ueye.is_WaitForNextImage(self.cam.handle(), 1000, imBuf.mem_ptr, imBuf.mem_id)
-			if retVal == ueye.IS_SUCCESS:
-				print( f"  ueye.IS_SUCCESS: image buffer id = {imBuf.mem_id}" )
-				self.copy_image( ImageData(self.cam.handle(), imBuf) )  # copy image_data 
-				if (self.npImage.size > 0): # ok 
-					self.image = np2qimage(self.npImage)
-					if (not self.image.isNull()):
-						self.pixmap = QPixmap.fromImage(self.image)
-						if self.curItem: 
-							self.scene.removeItem(self.curItem)
-						self.curItem = QGraphicsPixmapItem(self.pixmap)
-						self.scene.addItem(self.curItem)
-						self.scene.setSceneRect(0, 0, self.pixmap.width(), self.pixmap.height())
-						self.setWindowTitle( f"{self.appFileName} : Camera image" ) 
-						(w,h) = (self.pixmap.width(), self.pixmap.height())
-						self.status.setText( f"pixmap: (w,h) = ({w},{h})" )
-						self.scaleOne()
-						self.view.setMouseTracking(True)
-					else:
-						self.pixmap = QPixmap()
-					#end
-				else:  # empty image self.npImage
-					self.image = QImage()
-					self.pixmap = QPixmap()
-					print( "  no image in buffer " + str(imBuf) )
-				#
-			else: 
-				self.setWindowTitle( "{self.appFileName}: getOneImage() error retVal = {retVal}" )
-			#end if
-			self.setIsAllGray()
-			self.setMenuItems2()
-		#else:  
-		#	pass  # ignore action
-		return
 		
 	def cameraOff(self):
 		"""Turn IDS camera off and print some information."""
-		if ueyeOK and self.camOn:
+		if ueyeOK and self.camOn and (not self.capturing):
 			self.cam.exit()
 			self.camOn = False
 			self.setMenuItems2()
@@ -359,47 +408,45 @@ class MainWindow(inheritedMainWindow):
 	def blackDots(self):
 		"""Add black dots to image."""
 		if self.npImage.size > 0:
-			(w,h) = (self.npImage.shape[1], self.npImage.shape[0])
-			for i in range(0,w,10):
-				for j in range(0,h,10):
-					self.npImage[j:j+3,i:i+3] = 0
-			self.image = np2qimage(self.npImage)
-			self.pixmap = QPixmap.fromImage(self.image)
-			self.curItem = QGraphicsPixmapItem(self.pixmap)
-			self.scene.addItem(self.curItem)
-			self.scene.setSceneRect(0, 0, self.pixmap.width(), self.pixmap.height())
-			self.setWindowTitle( f"{self.appFileName} : Camera image with black dots" ) 
-			self.status.setText( f"pixmap: (w,h) = ({w},{h})" )
-			self.scaleOne()
+			# a 3x3 dot in each 10x10 block, set by one strided assignment for each of the 9 pixels in a dot
+			A = self.npImage
+			for dj in range(3):
+				for di in range(3):
+					A[dj::10, di::10] = 0
+			self.showNpImage("Camera image with black dots")   # npImage is changed (in place)
 		return
 
+	def houghCircles(self):
+		"""Return circles (x,y,r) found by cv2.HoughCircles() in image, or None.
+		Only circles with radius in the range given by '_eyeRadius', scaled by the image height, are searched for.
+		Circles are searched for in the full size image, in a half size image the small dice eyes are lost.
+		They are found once for each npImage; the gray image (from _getGray()) is cached too.
+		"""
+		if (self.circlesVersion != self._imgVersion):
+			gray = self._getGray()
+			f = gray.shape[0] / _eyeImageHeight   # ex. 0.5 for a subsampled camera image
+			(rMin, rMax) = (max(1, int(_eyeRadius[0]*f + 0.5)), max(2, int(_eyeRadius[1]*f + 0.5)))
+			circles = cv2.HoughCircles(gray, cv2.HOUGH_GRADIENT, 1, 20,
+									   param1=50, param2=30, minRadius=rMin, maxRadius=rMax)
+			(self.circles, self.circlesVersion) = (circles, self._imgVersion)
+		return self.circles
+	
 	def findCircles(self):
 		"""Find circles in image using cv2.HoughCircles()"""
 		if self.npImage.size > 0:
-			gray = cv2.cvtColor(self.npImage, cv2.COLOR_BGR2GRAY)
-			circles = cv2.HoughCircles(gray, cv2.HOUGH_GRADIENT, 1, 20,
-									   param1=50, param2=30, minRadius=0, maxRadius=0)
+			circles = self.houghCircles()
 			if circles is not None:
-				circles = np.round(circles[0, :]).astype(int)
+				circles = np.rint(circles[0]).astype(np.int32)   # (x,y,r) for each circle
 				for (x, y, r) in circles:
 					cv2.circle(self.npImage, (x, y), r, (0, 255, 0), 4)
-				self.image = np2qimage(self.npImage)
-				self.pixmap = QPixmap.fromImage(self.image)
-				self.curItem = QGraphicsPixmapItem(self.pixmap)
-				self.scene.addItem(self.curItem)
-				self.scene.setSceneRect(0, 0, self.pixmap.width(), self.pixmap.height())
-				self.setWindowTitle(f"{self.appFileName} : Camera image with circles")
-				(w, h) = (self.pixmap.width(), self.pixmap.height())
-				self.status.setText(f"pixmap: (w,h) = ({w},{h})")
-				self.scaleOne()
+				self.showNpImage("Camera image with circles")   # npImage is changed (in place)
+				self.circlesVersion = self._imgVersion   # but the found circles are still the circles
 		return
 
 	def countEyes(self):
 		"""A function to count the number of eyes once black dots are added to the image."""
 		if self.npImage.size > 0:
-			gray = cv2.cvtColor(self.npImage, cv2.COLOR_BGR2GRAY)
-			circles = cv2.HoughCircles(gray, cv2.HOUGH_GRADIENT, 1, 20,
-									   param1=50, param2=30, minRadius=0, maxRadius=0)
+			circles = self.houghCircles()
 			if circles is not None:
 				num_eyes = len(circles[0])
 				print(f"Number of eyes detected: {num_eyes}")
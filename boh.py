@@ -3,14 +3,16 @@
 # 
 # ../ELE610/py3/appImageViewer.py
 #
-#  includes classes: MyGraphicsView, MainWindow
+#  includes classes: MyImageLabel, MainWindow
 #
 #  Simple program that uses Qt to display an image, it has some few options.
 #    File menu: Open File, Clear Image, Print Info, and (Close and) Quit
 #    Scale menu: Scale 1, Scale Up, and Scale down
 #  In the bottom it display the value for pixel that mouse points on (without clicking)
 #  It can also print information for many of the attributes used
-#  This program does not use numpy or qimage2ndarray or ueye (IDS camera). 
+#  This program does not use qimage2ndarray or ueye (IDS camera), numpy is used by printShortInfo,
+#  to check if an image is gray (together with numba when it is installed), and to check if it is opaque.
+#  The pixel values shown are read from the memory of the image (memoryview of constBits()).
 #
 # Karl Skretting, UiS, September-October 2018, February 2019, November 2020, June 2022
 
@@ -25,82 +27,142 @@ _version = "1.0"
 
 import sys
 import os.path
+import numpy as np
 import cv2
 try:
-	from PyQt5.QtCore import Qt, QT_VERSION_STR   # QSize, QPoint, QRect, QRectF, 
-	from PyQt5.QtGui import QImage, QPixmap, QTransform
-	from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QFileDialog, QLabel, 
-			QGraphicsView, QGraphicsScene, QGraphicsPixmapItem)
+	from PyQt5.QtCore import Qt, QT_VERSION_STR, QTimer, QRect   # QSize, QPoint, QRectF, 
+	from PyQt5.QtGui import QImage, QImageReader, QPixmap, QPixmapCache, QPainter
+	from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QFileDialog, QLabel, QScrollArea)
 except ImportError:
 	raise ImportError( f"{_appFileName}: Requires PyQt5." )
 #end try, import PyQt5 classes 
 myPath = ''                # path where you may have some images
 #end try, import DBpath  
 
-class MyGraphicsView(QGraphicsView):
-	"""A simple extension of QGraphicsView, the viewer where the pixmap is shown 
+try:
+	from numba import njit
+	numbaOK = True
+except ImportError:
+	numbaOK = False   # --> may run program even without numba, QImage.allGray() is used instead
+#end try, import numba
+
+if numbaOK:
+	@njit(cache=True, nogil=True)
+	def _isAllGray(A):
+		"""Return True if r == g == b for all pixels in 'A', an (h,w,4) array of (b,g,r,a) or (r,g,b,a) bytes.
+		The scan stops at the first pixel that is not gray, which is early for most color images.
+		"""
+		(h, w) = (A.shape[0], A.shape[1])
+		for j in range(h):
+			for i in range(w):
+				if (A[j,i,0] != A[j,i,1]) or (A[j,i,1] != A[j,i,2]):
+					return False
+		return True
+#end if numbaOK
+
+_scaledCacheKB = 64*1024   # QPixmapCache limit (in KB) for the scaled down pixmaps, see scaledPixmap()
+_maxScaledSide = 32767     # largest width or height of the scaled image in the label (as X11 windows)
+
+_testImage = "Image1crop.png"   # short info on it is printed at start when '--test' is on the command line
+
+class MyImageLabel(QLabel):
+	"""A simple extension of QLabel, the label where the pixmap is shown, it is put in a scroll area. 
 	Mouse events are processed in this class, 
-	and some variables belonging to the parent (MainWindow object) are used
+	and some variables belonging to the main window (MainWindow object) are used
 	"""
-	def __init__(self, scene, parent = None):
-		"""Initialize as for the inherited class 'QGraphicView', then set mouse tracking to True."""
-		super().__init__(scene, parent)
+	def __init__(self, mainWin):
+		"""Initialize as for the inherited class 'QLabel', then set mouse tracking to True."""
+		super().__init__()
+		self.mainWin = mainWin    # the scroll area becomes parent, so parent() is not the main window 
+		self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
 		self.setMouseTracking(True)
+		self.lastXY = (-1,-1)     # pixel (x,y) for last position information text
+		self.posCleared = False   # true when position information text is " " (mouse outside image)
+		self.zoomPixmap = None    # pixmap scaled up by 'self.zoom' when painted, see setZoomPixmap()
+		self.zoom = 1.0
+		return
+		
+	def setZoomPixmap(self, pixmap, zoom=1.0):
+		"""Show 'pixmap' scaled up by 'zoom', it is scaled when (the visible part of) it is painted, 
+		so no large scaled pixmap is made. If 'pixmap' is None the label shows its own pixmap (QLabel) again.
+		"""
+		self.zoomPixmap = pixmap
+		self.zoom = zoom
+		if pixmap is not None:
+			self.clear()
+			self.resize(round(pixmap.width()*zoom), round(pixmap.height()*zoom))
+		self.update()
+		return
+		
+	def paintEvent(self, event):
+		"""Paint the pixels of 'self.zoomPixmap' that are in the exposed part of the label, each as a square,
+		or paint as QLabel does when there is no zoom pixmap.
+		"""
+		if self.zoomPixmap is None:
+			super().paintEvent(event)
+			return
+		f = self.zoom
+		r = event.rect()
+		(x0, y0) = (int(r.left()/f), int(r.top()/f))
+		(x1, y1) = (int((r.right()+1)/f) + 1, int((r.bottom()+1)/f) + 1)
+		src = QRect(x0, y0, x1-x0, y1-y0).intersected(self.zoomPixmap.rect())
+		painter = QPainter(self)
+		painter.scale(f, f)   # no SmoothPixmapTransform, as Qt.FastTransformation
+		painter.drawPixmap(src, self.zoomPixmap, src)
+		painter.end()
 		return
 		
+	def mapToPixel(self, pos):
+		"""Return (x,y), the pixel index in the image, for position 'pos' in the label.
+		The pixmap in the label may be a scaled pixmap, see MainWindow.setScaleLevel().
+		"""
+		f = self.mainWin.pixmapScale
+		return (int(pos.x()/f), int(pos.y()/f))
+		
 	def mousePressEvent(self, event):
 		"""Just print where the mouse is when a mouse button is pressed.
-		Note that event.pos() gives the location in the view, while (x,y) gives the
-		location in the scene, which here corresponds to the pixel index of the pixmap.
-		This method is a 'slot' that is called whenever a mouse button is pressed (in the view).
+		Note that event.pos() gives the location in the label, i.e. in the (perhaps scaled) pixmap, 
+		while (x,y) gives the pixel index of the image.
+		This method is a 'slot' that is called whenever a mouse button is pressed (in the label).
 		"""
-		posScene = self.mapToScene(event.pos())
-		(x,y) = (int(posScene.x()), int(posScene.y()))
+		(x,y) = self.mapToPixel(event.pos())
 		#
 		if (event.button() == Qt.LeftButton):
-			print("MyGraphicsView.mousePressEvent(): Press LeftButton at:  ", end='') 
+			print("MyImageLabel.mousePressEvent(): Press LeftButton at:  ", end='') 
 		if (event.button() == Qt.RightButton):
-			print("MyGraphicsView.mousePressEvent(): Press RightButton at: ", end='')
-		print( f"{str(event.pos())}, in scene at (x,y) = ({x},{y})" )
+			print("MyImageLabel.mousePressEvent(): Press RightButton at: ", end='')
+		print( f"{str(event.pos())}, in image at (x,y) = ({x},{y})" )
 		return 
 		
 	def mouseMoveEvent(self, event):
 		"""Displays position of mouse pointer and, from the QImage object, the pixel color. 
-		This method is a 'slot' that is called whenever the mouse moves over the view.
+		This method is a 'slot' that is called whenever the mouse moves over the label.
 		"""
-		p = self.parent()    # gives easy access to parent attributes here
-		posScene = self.mapToScene(event.pos())
-		(x,y) = (int(posScene.x()), int(posScene.y()))
-		# p.pixmap and p.image should be different representations of the same image, and thus of the same size
-		if ((x >= 0) and (y >= 0) and (y < p.pixmap.height()) and (x < p.pixmap.width())):
-			if not p.image.isNull():  
-				col = p.image.pixelColor(x, y)
-				if p.isAllGray: 
-					p.posInfo.setText( f"(x,y) = ({x},{y}):  gray = {col.red()}" )   # or col.value()
-				elif (p.image.format() == QImage.Format_Indexed8): 
-					p.posInfo.setText( f"(x,y) = ({x},{y}):  gray/index  = {col.value()}" )
-				else: # QImage.Format_RGB32, or other
-					(r,g,b,a) = (col.red(), col.green(), col.blue(), col.alpha())
-					if (a == 255):
-						p.posInfo.setText( f"(x,y) = ({x},{y}):  (r,g,b) = ({r},{g},{b})" )
-					else:
-						p.posInfo.setText( f"(x,y) = ({x},{y}):  (r,g,b,a) = ({r},{g},{b},{a})" )
-			else: 
-				p.posInfo.setText( f"(x,y) = ({x},{y})" )
-		else:
-			p.posInfo.setText(" ") 
+		p = self.mainWin    # gives easy access to main window attributes here
+		(x,y) = self.mapToPixel(event.pos())
+		if ((x,y) == self.lastXY):
+			return   # still on the same pixel, text is already set
+		self.lastXY = (x,y)
+		# p.pixmap and p.image should be different representations of the same image, and thus of the same size,
+		# (p.imgW, p.imgH) is the size of the pixmap (not scaled) in label, and (0,0) when there is none
+		if ((x >= 0) and (y >= 0) and (y < p.imgH) and (x < p.imgW)):
+			p.setPosText( p.posFormatter(x, y) )   # chosen for the image in setPosFormatter()
+			self.posCleared = False
+		elif not self.posCleared:
+			p.setPosText(" ") 
+			self.posCleared = True
 		return
 
 	def mouseReleaseEvent(self, event):
 		"""Just print when the left mouse button is released.
 		This method is a 'slot' that is called whenever a mouse button is 
-		released (after being pressed in the view).
+		released (after being pressed in the label).
 		"""
 		if (event.button() == Qt.LeftButton):
-			print("MyGraphicsView.mouseReleaseEvent():  Left Button released.")
+			print("MyImageLabel.mouseReleaseEvent():  Left Button released.")
 		#end if
 		return
-	#end class MyGraphicsView
+	#end class MyImageLabel
 
 class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 	"""MainWindow class for this simple image viewer."""
@@ -109,7 +171,7 @@ class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 	def __init__(self, fName="", parent=None):
 		"""Initialize the main window object with title, location and size,
 		an empty image (represented both as pixmap and image), 
-		empty scene and empty view, labels for status and position information.
+		an empty label in a scroll area, labels for status and position information.
 		A file name 'fName' may be given as input (from command line when program is started)
 		and if so the file (an image) will be opened and displayed.
 		"""
@@ -118,17 +180,30 @@ class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 		self.appFileName = _appFileName 
 		self.setGeometry(150, 50, 1400, 800)  # initial window position and size
 		self.scaleUpFactor = 2
+		self.scaleLevel = 0          # pixmap in label is scaled by scaleUpFactor**scaleLevel, see setScaleLevel()
+		self.pixmapScale = 1.0       # and this is the scale factor
 		#
 		self.pixmap = QPixmap()      # a null pixmap
 		self.image = QImage()        # a null image
+		(self.imgW, self.imgH) = (0, 0)   # size of pixmap in label, as plain ints
 		self.isAllGray = False       # true when self.image.allGray() 
 		# the allGray() function is slow for images without color table
+		self.pixelReader = None      # function (x,y) --> (r,g,b,a) for self.image, see setPixelReader()
+		self.imageBits = None        # memoryview of the pixels in self.image, used by pixelReader
+		self.posFormatter = None     # function (x,y) --> position information text, see setPosFormatter()
 		#
-		self.scene = QGraphicsScene()
-		self.curItem = None          # (a pointer to) pixmap on scene
-		self.view = MyGraphicsView(self.scene, parent=self)
+		self.pixmapShown = False     # true when (a scaled) pixmap is shown in label
+		self.menuBatch = False       # true while setMenuItems() should wait, see openFile()
+		self.label = MyImageLabel(self)
+		self.scroll = QScrollArea(parent=self)   # the label, as large as the pixmap, is shown in this 
+		self.scroll.setWidget(self.label)
 		self.status = QLabel('Open image to display it.', parent = self)
 		self.posInfo = QLabel(' ', parent = self)
+		self.pendingPos = ' '        # the latest position information text, shown by flushPosText()
+		self.posTimer = QTimer(self) # the text is shown at most once for each 16 ms, see setPosText()
+		self.posTimer.setSingleShot(True)
+		self.posTimer.timeout.connect(self.flushPosText)
+		QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), _scaledCacheKB))   # only raise it
 		#
 		self.initMenu()  # menu is needed before (!) self.openFile(..)
 		#
@@ -157,7 +232,7 @@ class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 		qaOpenFileDlg.triggered.connect(self.openFileDlg)
 		self.qaClearImage = QAction('Clear Image', self)
 		self.qaClearImage.setShortcut('Ctrl+C')
-		self.qaClearImage.setToolTip('Remove the current pixmap item from scene.')
+		self.qaClearImage.setToolTip('Remove the current pixmap from label.')
 		self.qaClearImage.triggered.connect(self.removePixmapItem)
 		qaPrintInfo = QAction('printInfo', self)
 		qaPrintInfo.setShortcut('Ctrl+I')
@@ -198,8 +273,10 @@ class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 	
 # Some methods that may be used by several of the menu actions
 	def setMenuItems(self):
-		"""Enable/disable menu items as appropriate."""
-		pixmapOK = ((not self.pixmap.isNull()) and isinstance(self.curItem, QGraphicsPixmapItem))
+		"""Enable/disable menu items as appropriate, not done while 'self.menuBatch' is True."""
+		if self.menuBatch:
+			return   # done once when the batch of changes is finished
+		pixmapOK = ((not self.pixmap.isNull()) and self.pixmapShown)
 		self.qaClearImage.setEnabled(pixmapOK)
 		self.qaScaleOne.setEnabled(pixmapOK)
 		self.qaScaleUp.setEnabled(pixmapOK)
@@ -215,11 +292,128 @@ class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 		elif (value > 0):
 			self.isAllGray = True
 		else:
-			self.isAllGray = self.image.allGray()
+			self.isAllGray = self.imageAllGray()
 		#
+		self.setPosFormatter()
 		self.setMenuItems()
 		return
 		
+	def imageAllGray(self):
+		"""Return the same as 'self.image.allGray()', but for 32 bit images the numba function 
+		_isAllGray() is used (if available) on the memory of the image, read by constBits() (no copy).
+		"""
+		img = self.image
+		if numbaOK and (img.format() in (QImage.Format_RGB32, QImage.Format_ARGB32, 
+				QImage.Format_RGBA8888, QImage.Format_RGBX8888)):
+			ptr = img.constBits()
+			ptr.setsize(img.sizeInBytes())
+			A = np.frombuffer(ptr, dtype=np.uint8).reshape(img.height(), img.bytesPerLine()//4, 4)
+			return _isAllGray(A[:, :img.width(), :])
+		return img.allGray()
+		
+	def setPosText(self, text):
+		"""Set the position information text, it is shown in 'self.posInfo' when 'self.posTimer' times out.
+		Many mouse moves within 16 ms (about 60 Hz) thus give only one new text in the label.
+		"""
+		self.pendingPos = text
+		if not self.posTimer.isActive():
+			self.posTimer.start(16)
+		return
+		
+	def flushPosText(self):
+		"""Show the latest position information text in 'self.posInfo'."""
+		self.posInfo.setText(self.pendingPos)
+		return
+		
+	def imageOpaque(self):
+		"""Return True if alpha is 255 for all pixels in 'self.image', i.e. if it has no alpha channel 
+		or all alpha values are 255. The alpha bytes are read from the memory of the image (no copy).
+		"""
+		img = self.image
+		if not img.hasAlphaChannel():
+			return True
+		if img.format() in (QImage.Format_ARGB32, QImage.Format_RGBA8888):   # alpha is byte 3, (b,g,r,a) or (r,g,b,a)
+			ptr = img.constBits()
+			ptr.setsize(img.sizeInBytes())
+			A = np.frombuffer(ptr, dtype=np.uint8).reshape(img.height(), img.bytesPerLine()//4, 4)
+			return bool(A[:, :img.width(), 3].min() == 255)
+		return False
+		
+	def setPosFormatter(self):
+		"""Set 'self.posFormatter' to a function (x,y) --> text with position and pixel value.
+		The function is chosen once for the image, i.e. for 'self.pixelReader', format, alpha and 'self.isAllGray', 
+		so the label's mouseMoveEvent() does not need to test these for each mouse move.
+		"""
+		read = self.pixelReader
+		if read is None:
+			def fmtPos(x, y):
+				return f"(x,y) = ({x},{y})"
+		elif self.isAllGray: 
+			def fmtPos(x, y):
+				return f"(x,y) = ({x},{y}):  gray = {read(x, y)[0]}"
+		elif (self.image.format() == QImage.Format_Indexed8): 
+			def fmtPos(x, y):
+				(r,g,b,a) = read(x, y)
+				return f"(x,y) = ({x},{y}):  gray/index  = {max(r,g,b)}"   # as QColor.value()
+		elif self.imageOpaque():   # QImage.Format_RGB32, or other, alpha is always 255
+			def fmtPos(x, y):
+				(r,g,b,a) = read(x, y)
+				return f"(x,y) = ({x},{y}):  (r,g,b) = ({r},{g},{b})"
+		else: # QImage.Format_ARGB32, or other with alpha channel
+			def fmtPos(x, y):
+				(r,g,b,a) = read(x, y)
+				return f"(x,y) = ({x},{y}):  (r,g,b,a) = ({r},{g},{b},{a})"
+		self.posFormatter = fmtPos
+		self.label.lastXY = (-1,-1)   # text should be made again, also for the same pixel
+		return
+		
+	def setPixelReader(self):
+		"""Set 'self.pixelReader' to a function (x,y) --> (r,g,b,a) for the pixels of 'self.image'.
+		The function is chosen once for the format of the image, and for the common formats it reads 
+		the bytes from the memory of the image (constBits() does not copy or detach), no QColor is made.
+		"""
+		self.pixelReader = None
+		self.imageBits = None
+		img = self.image
+		if img.isNull():
+			return
+		fmt = img.format()
+		if fmt in (QImage.Format_RGB32, QImage.Format_ARGB32, QImage.Format_RGBA8888, QImage.Format_RGBX8888, 
+				QImage.Format_Grayscale8, QImage.Format_Indexed8):
+			ptr = img.constBits()
+			ptr.setsize(img.sizeInBytes())
+			bits = self.imageBits = memoryview(ptr)
+			bpl = img.bytesPerLine()
+			if (fmt == QImage.Format_Grayscale8):
+				def readGray(x, y):
+					v = bits[y*bpl + x]
+					return (v, v, v, 255)
+				self.pixelReader = readGray
+			elif (fmt == QImage.Format_Indexed8):   # each pixel is one byte, an index into the color table
+				colors = [((v >> 16) & 255, (v >> 8) & 255, v & 255, v >> 24) for v in img.colorTable()]
+				colors += [(0, 0, 0, 255)]*(256 - len(colors))   # any index gives a color
+				def readIndexed(x, y):
+					return colors[bits[y*bpl + x]]
+				self.pixelReader = readIndexed
+			elif fmt in (QImage.Format_RGBA8888, QImage.Format_RGBX8888):   # each pixel is 4 bytes (r,g,b,a)
+				def readRGBA(x, y):
+					i = y*bpl + 4*x
+					return (bits[i], bits[i+1], bits[i+2], bits[i+3])
+				self.pixelReader = readRGBA
+			else:   # each pixel is one 32 bit (native) int, a QRgb value 0xAARRGGBB
+				words = bits.cast('I')
+				wpl = bpl//4   # ints for each line
+				def readRGB32(x, y):
+					v = words[y*wpl + x]
+					return ((v >> 16) & 255, (v >> 8) & 255, v & 255, v >> 24)
+				self.pixelReader = readRGB32
+		else:   # other formats, let Qt find the color
+			def readColor(x, y):
+				col = img.pixelColor(x, y)
+				return (col.red(), col.green(), col.blue(), col.alpha())
+			self.pixelReader = readColor
+		return
+		
 # Methods for actions on the File-menu
 	def openFileDlg(self):
 		"""Use the Qt file open dialog to select an image to open."""
@@ -233,84 +427,104 @@ class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 		
 	def openFile(self, fName):   
 		"""Open the (image) file both as image (QImage) and pixmap (QPixmap).
-		The pixmap is added as an item to the graphics scene which is shown in the graphics view.
-		The view is scaled to unity.
+		The pixmap is shown in the label, which is in a scroll area.
+		The pixmap is shown not scaled.
 		""" 
 		# print( f"File {_appFileName}: (debug) first line in openFile()" )
-		if (fName != ""):
-			self.removePixmapItem()
-			print( f"Try to load {fName} into pixmap (image)" )
-			self.pixmap.load(fName) 
-			# If the file does not exist or is of an unknown format, the pixmap becomes a null pixmap.
-			self.image = self.pixmap.toImage()   # and image or a null image
-			self.setIsAllGray()
-			# print(self.image.format())  often 4, QImage::Format_RGB32 
-			if (not self.pixmap.isNull()): # ok
-				self.curItem = QGraphicsPixmapItem(self.pixmap)
-				self.scene.addItem(self.curItem)
-				(w, h) = (self.pixmap.width(), self.pixmap.height())
-				self.scene.setSceneRect(0, 0, w, h)
-				self.setWindowTitle( f"{self.appFileName} : {fName}" )
-				self.status.setText( f"pixmap: (w,h) = ({w},{h})" )
-				self.scaleOne()
-			else:
-				self.setWindowTitle( f"{self.appFileName} : error for file {fName}" )
+		self.menuBatch = True   # menu items are set once, at the end
+		try:
+			if (fName != ""):
+				self.removePixmapItem()
+				print( f"Try to load {fName} into pixmap (image)" )
+				# the file is decoded once, into the image, and the pixmap is made from it
+				# If the file does not exist, is of an unknown format or has a known empty size, it is not 
+				# decoded and the image becomes a null image. Some formats do not give the size before 
+				# decoding, size() is then invalid (-1,-1), and read() gives a null image if decoding fails.
+				reader = QImageReader(fName)
+				sz = reader.size()
+				if reader.canRead() and not (sz.isValid() and sz.isEmpty()):
+					self.image = reader.read()   # same reader, the header is not read again
+				else:
+					self.image = QImage()
+				#end if
+				self.pixmap = QPixmap.fromImage(self.image, Qt.NoFormatConversion)   # and a null pixmap
+				if (not self.image.isNull()) and (self.image.format() not in (QImage.Format_RGB32, 
+						QImage.Format_ARGB32, QImage.Format_Grayscale8, QImage.Format_Indexed8)):
+					# other formats are converted once, in one pass, to 4 bytes (r,g,b,a) for each pixel
+					# and RGBX8888 (a is 255) keeps that the image has no alpha channel, see setPosFormatter()
+					if self.image.hasAlphaChannel():
+						self.image = self.image.convertToFormat(QImage.Format_RGBA8888)
+					else:
+						self.image = self.image.convertToFormat(QImage.Format_RGBX8888)
+				self.setPixelReader()
+				self.setIsAllGray()
+				# print(self.image.format())  often 4, QImage::Format_RGB32 
+				if (not self.pixmap.isNull()): # ok
+					self.pixmapShown = True
+					(w, h) = (self.imgW, self.imgH) = (self.pixmap.width(), self.pixmap.height())
+					self.setWindowTitle( f"{self.appFileName} : {fName}" )
+					self.status.setText( f"pixmap: (w,h) = ({w},{h})" )
+					self.scaleOne()
+					QTimer.singleShot(0, self.makeScaledPixmaps)   # when the event loop is idle, only the smaller ones
+				else:
+					self.setWindowTitle( f"{self.appFileName} : error for file {fName}" )
+				#end if
 			#end if
-		#end if
+		finally:
+			self.menuBatch = False
 		self.setMenuItems()
 		# print( f"File {_appFileName}: (debug) last line in openFile()" )
 		return
 	#end function openFile 
 		
 	def removePixmapItem(self):
-		"""Removes the current pixmap item from the scene if it exists."""
-		if self.curItem: 
-			self.scene.removeItem(self.curItem)
-			self.curItem = None
+		"""Removes the current pixmap from the label if it is shown."""
+		if self.pixmapShown: 
+			for level in (-1, -2, -3):   # scaled pixmaps of this pixmap are not used any more
+				QPixmapCache.remove(f"{self.pixmap.cacheKey()}:{level}")
+			self.label.setZoomPixmap(None)
+			self.label.clear()
+			self.label.resize(0, 0)
+			self.pixmapShown = False
 			self.setMenuItems()
+		(self.imgW, self.imgH) = (0, 0)   # no position information either
+		self.label.lastXY = (-1,-1)
 		self.setWindowTitle(self.appFileName)
-		self.status.setText('No pixmap (image) on scene.')
+		self.status.setText('No pixmap (image) in label.')
 		return
 	#end function removePixmapItem
 	
 	def printInfo(self):
 		"""Print some general (debug) information for the program and the image."""
-		print( "Print some elements of MainWindow(QMainWindow) object.")
-		print( f"myPath             = {str(myPath)}" )
-		print( f"self               = {str(self)}" )
-		print( f"  .parent()          = {str(self.parent())}" )
-		print( f"  .appFileName       = {str(self.appFileName)}" )
-		print( f"  .pos()             = {str(self.pos())}" )
-		print( f"  .size()            = {str(self.size())}" )
-		print( f"  .isAllGray         = {str(self.isAllGray)}" )
-		print( f"  .scaleUpFactor     = {str(self.scaleUpFactor)}" )
-		print( f"  .curItem           = {str(self.curItem)}" )
-		print( f"self.view          = {str(self.view)}" )
-		print( f"  .parent()          = {str(self.view.parent())}" )
-		print( f"  .scene()           = {str(self.view.scene())}" )
-		print( f"  .pos()             = {str(self.view.pos())}" )
-		print( f"  .size()            = {str(self.view.size())}" )
-		t = self.view.transform()
-		print( f"  .transform()       = {str(t)}" )
-		print( f"    .m11, .m12, .m13   = [{t.m11():5.2f}, {t.m12():5.2f}, {t.m13():5.2f}, " )
-		print( f"    .m21, .m22, .m23   =  {t.m21():5.2f}, {t.m22():5.2f}, {t.m23():5.2f}, " )
-		print( f"    .m31, .m32, .m33   =  {t.m31():5.2f}, {t.m32():5.2f}, {t.m33():5.2f} ]" )
-		print( f"self.scene         = {str(self.scene)}" )
-		print( f"  .parent()          = {str(self.scene.parent())}" )
-		print( f"  .sceneRect()       = {str(self.scene.sceneRect())}" )
-		print( f"  number of items    = {len(self.scene.items())}" )
-		if len(self.scene.items()):
-			print( f"  first item         = {str(self.scene.items()[0])}" )
-		print( f"self.pixmap        = {str(self.pixmap)}" )
+		lines = [ "Print some elements of MainWindow(QMainWindow) object." ]
+		lines.append( f"myPath             = {myPath}" )
+		lines.append( f"self               = {self}" )
+		lines.append( f"  .parent()          = {self.parent()}" )
+		lines.append( f"  .appFileName       = {self.appFileName}" )
+		lines.append( f"  .pos()             = {self.pos()}" )
+		lines.append( f"  .size()            = {self.size()}" )
+		lines.append( f"  .isAllGray         = {self.isAllGray}" )
+		lines.append( f"  .scaleUpFactor     = {self.scaleUpFactor}" )
+		lines.append( f"  .scaleLevel        = {self.scaleLevel}" )
+		lines.append( f"  .pixmapShown       = {self.pixmapShown}" )
+		lines.append( f"self.scroll        = {self.scroll}" )
+		lines.append( f"  .parent()          = {self.scroll.parent()}" )
+		lines.append( f"  .pos()             = {self.scroll.pos()}" )
+		lines.append( f"  .size()            = {self.scroll.size()}" )
+		lines.append( f"self.label         = {self.label}" )
+		lines.append( f"  .parent()          = {self.label.parent()}" )
+		lines.append( f"  .pos()             = {self.label.pos()}" )
+		lines.append( f"  .size()            = {self.label.size()}" )
+		lines.append( f"self.pixmap        = {self.pixmap}" )
 		if not self.pixmap.isNull():
-			print( f"  .size()            = {str(self.pixmap.size())}" )
-			print( f"  .width()           = {str(self.pixmap.width())}" )
-			print( f"  .height()          = {str(self.pixmap.height())}" )
-			print( f"  .depth()           = {str(self.pixmap.depth())}" )
-			print( f"  .hasAlpha()        = {str(self.pixmap.hasAlpha())}" ) 
-			print( f"  .isQBitmap()       = {str(self.pixmap.isQBitmap())}" )
+			lines.append( f"  .size()            = {self.pixmap.size()}" )
+			lines.append( f"  .width()           = {self.pixmap.width()}" )
+			lines.append( f"  .height()          = {self.pixmap.height()}" )
+			lines.append( f"  .depth()           = {self.pixmap.depth()}" )
+			lines.append( f"  .hasAlpha()        = {self.pixmap.hasAlpha()}" ) 
+			lines.append( f"  .isQBitmap()       = {self.pixmap.isQBitmap()}" )
 		#end if pixmap
-		print( f"self.image         = {str(self.image)}" )
+		lines.append( f"self.image         = {self.image}" )
 		if not self.image.isNull():
 			if (self.image.format() == 3):
 				s2 = "3 (QImage.Format_Indexed8)"
@@ -321,19 +535,29 @@ class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 			else:
 				s2 = f"{self.image.format()}" 
 			#end
-			print( f"  .size()            = {str(self.image.size())}" )
-			print( f"  .width()           = {str(self.image.width())}" )
-			print( f"  .height()          = {str(self.image.height())}" )
-			print( f"  .depth()           = {str(self.image.depth())}" )
-			print( f"  .hasAlphaChannel() = {str(self.image.hasAlphaChannel())}" )
-			print( f"  .format()          = {s2}" )
-			print( f"  .allGray()         = {str(self.image.allGray())}" )
+			lines.append( f"  .size()            = {self.image.size()}" )
+			lines.append( f"  .width()           = {self.image.width()}" )
+			lines.append( f"  .height()          = {self.image.height()}" )
+			lines.append( f"  .depth()           = {self.image.depth()}" )
+			lines.append( f"  .hasAlphaChannel() = {self.image.hasAlphaChannel()}" )
+			lines.append( f"  .format()          = {s2}" )
+			lines.append( f"  .allGray()         = {self.image.allGray()}" )
 		#end if image
+		sys.stdout.write("\n".join(lines) + "\n")   # one write for all lines
 		return
 
 	def printShortInfo(self):
-		img = cv2.imread(self.pixmap)
+		"""Print short information on the image as a numpy array, a view of the memory of 'self.image' (no copy)."""
+		if self.image.isNull() or (self.image.depth() < 8):
+			print( "printShortInfo: no image (or less than 8 bits for each pixel)." )
+			return
+		(w, h, nc) = (self.image.width(), self.image.height(), self.image.depth()//8)   # nc bytes for each pixel
+		ptr = self.image.constBits()
+		ptr.setsize(self.image.sizeInBytes())
+		img = np.frombuffer(ptr, dtype=np.uint8).reshape(h, self.image.bytesPerLine())
+		img = img[:, :w*nc].reshape(h, w, nc) if (nc > 1) else img[:, :w]   # without padding at end of lines
 		print( f"{img.dtype = }, {img.size = }, {img.ndim = }, {img.shape = }" )
+		return
 
 	def closeWin(self):
 		"""Quit program."""
@@ -341,38 +565,84 @@ class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 		self.close()   # the correct way to quit, is as (upper right) window frame symbol "X" 
 		return
 		
-# Methods for actions on the Scale-menu, which modify the view transform
+# Scaled pixmaps, used by the actions on the Scale-menu
+	def scaledPixmap(self, level):
+		"""Return 'self.pixmap' scaled down by 'self.scaleUpFactor'**level, level is from -3 to 0.
+		The scaled pixmaps are kept in QPixmapCache, its limit is set to '_scaledCacheKB' in __init__(), 
+		so each is made only once as long as the cache has room.
+		Larger levels are not made as pixmaps, they are scaled when painted, see setScaleLevel().
+		"""
+		if (level >= 0):
+			return self.pixmap
+		key = f"{self.pixmap.cacheKey()}:{level}"
+		pm = QPixmapCache.find(key)
+		if (pm is None) or pm.isNull():
+			f = self.scaleUpFactor**level
+			pm = self.pixmap.scaled(max(1, round(self.imgW*f)), max(1, round(self.imgH*f)), 
+									Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+			QPixmapCache.insert(key, pm)
+		return pm
+		
+	def makeScaledPixmaps(self):
+		"""Make the scaled pixmaps for scaleDown() (1/2, 1/4, 1/8) in advance, 
+		together they are about a third of the size of the pixmap."""
+		if (not self.pixmap.isNull()):
+			for level in (-1, -2, -3):
+				self.scaledPixmap(level)
+		return
+		
+	def setScaleLevel(self, level):
+		"""Show the pixmap scaled by 'self.scaleUpFactor'**level in label, level is from -3 to 3.
+		Scaled up, each pixel is painted as a square by the label, scaled down a smooth pixmap is shown.
+		A level where the image would be larger than '_maxScaledSide' is not used.
+		"""
+		if (not self.pixmap.isNull()) and self.pixmapShown:
+			level = max(-3, min(3, level))
+			f = self.scaleUpFactor**level
+			if (max(self.imgW, self.imgH)*f > _maxScaledSide):
+				self.status.setText( f"pixmap: scale {f} not used, image would be larger than {_maxScaledSide} pixels" )
+				return
+			self.scaleLevel = level
+			self.pixmapScale = self.scaleUpFactor**self.scaleLevel
+			if (self.scaleLevel > 0):
+				self.label.setZoomPixmap(self.pixmap, self.pixmapScale)
+			else:
+				pm = self.scaledPixmap(self.scaleLevel)
+				self.label.setZoomPixmap(None)
+				self.label.setPixmap(pm)
+				self.label.resize(pm.size())
+			self.label.lastXY = (-1,-1)   # same pixel index may now be another place in the label
+		return
+		
+# Methods for actions on the Scale-menu, which show a scaled pixmap
 	def scaleOne(self):
-		"""Scale to 1, i.e. set the transform to identity matrix"""
-		if not self.pixmap.isNull():
-			self.view.setTransform(QTransform())  # identity
+		"""Scale to 1, i.e. show the pixmap itself"""
+		self.setScaleLevel(0)
 		return
 	
 	def scaleUp(self):
-		"""Scale up the view by factor set by 'self.scaleUpFactor'"""
-		if not self.pixmap.isNull():
-			self.view.scale(self.scaleUpFactor, self.scaleUpFactor)  
+		"""Scale up the pixmap by factor set by 'self.scaleUpFactor'"""
+		self.setScaleLevel(self.scaleLevel + 1)
 		return
 		
 	def scaleDown(self):
-		"""Scale down the view by factor set by 1.0/'self.scaleUpFactor'"""
-		if not self.pixmap.isNull():
-			self.view.scale(1.0/self.scaleUpFactor, 1.0/self.scaleUpFactor)  
+		"""Scale down the pixmap by factor set by 1.0/'self.scaleUpFactor'"""
+		self.setScaleLevel(self.scaleLevel - 1)
 		return
 	
 # Finally, some methods used as slots for common actions
 	def resizeEvent(self, arg1):
-		"""Make the size of the view follow any changes in the size of the main window.
+		"""Make the size of the scroll area follow any changes in the size of the main window.
 		This method is a 'slot' that is called whenever the size of the main window changes.
 		"""
-		self.view.setGeometry( 0, 20, self.width(), self.height()-50 ) 
+		self.scroll.setGeometry( 0, 20, self.width(), self.height()-50 ) 
 		self.status.setGeometry(5, self.height()-29, (self.width()//2)-10, 28) 
 		self.posInfo.setGeometry((self.width()//2)+5, self.height()-29, (self.width()//2)-10, 28) 
 		return
 	
 	def mousePressEvent(self, event):
 		"""Just print which mouse button has been pressed in the main window.
-		Note that the view catches most mouse events, so this does only happen
+		Note that the scroll area (and label) catches most mouse events, so this does only happen
 		when mouse is on the bottom of the main window; the status line.
 		Normally we are fine if this function does nothing (is not included here).
 		This method is a 'slot' that is called whenever a mouse button is pressed (in the main window).
@@ -388,8 +658,13 @@ class MainWindow(QMainWindow):    #  and QMainWindow inherits QWidget
 if __name__ == '__main__':
 	print( f"{_appFileName}: (version {_version}), path for images is: {myPath}" )
 	print( f"{_appFileName}: Using Qt {QT_VERSION_STR}" )
-	img = cv2.imread("Image1crop.png") # filename is a string with the name of the file
-	print( f"{img.dtype = }, {img.size = }, {img.ndim = }, {img.shape = }" )
+	if ("--test" in sys.argv):
+		sys.argv.remove("--test")   # then sys.argv[1] is still the file to open
+		img = cv2.imread(_testImage) # filename is a string with the name of the file
+		if img is not None:
+			print( f"{img.dtype = }, {img.size = }, {img.ndim = }, {img.shape = }" )
+		else:
+			print( f"{_appFileName}: could not read test image {_testImage}" )
 	mainApp = QApplication(sys.argv)
 	if (len(sys.argv) >= 2):
 		fn = sys.argv[1]